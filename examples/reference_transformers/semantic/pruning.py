@@ -44,11 +44,14 @@ CUSTOMIZATION IDEAS:
 """
 
 import logging
+from itertools import compress
+
+import numpy as np
 
 from textile.core.context_window import ContextWindow
 from textile.core.turn_state import TurnState
 from textile.transformers.base import ContextTransformer
-from textile.utils.similarity import cosine_similarity
+from textile.utils import normalize
 
 logger = logging.getLogger(__name__)
 
@@ -82,7 +85,7 @@ class SemanticPruningTransformer(ContextTransformer):
 
         IMPLEMENTATION PATTERN:
         1. Get query embedding from state
-        2. Compute similarity for each message
+        2. Compute similarity for all messages in one matrix product
         3. Filter below threshold (with error handling)
         4. Ensure at least one message remains (fail-safe)
         5. Remove filtered messages (immutable)
@@ -97,54 +100,71 @@ class SemanticPruningTransformer(ContextTransformer):
         query_embedding = state.user_embedding
         to_remove: list[str] = []
 
-        # STEP 1: Compute similarity for each message
-        for msg in context.messages:
-            # Skip system messages (instructions always relevant)
-            if msg.role == "system" or msg.embedding is None:
-                continue
-
-            try:
-                # PATTERN: Cosine similarity between query and message
-                similarity = cosine_similarity(query_embedding, msg.embedding)
-                if similarity < self.threshold:
-                    to_remove.append(msg.id)
-            except (ValueError, RuntimeError) as e:
-                # PATTERN: Fail-safe - keep message on error
-                logger.warning(f"Failed to compute similarity for message {msg.id}: {e}")
-                # Keep message on error (conservative approach)
+        # STEP 1: Compute similarity for all candidate messages at once
+        if query_embedding is not None:
+            query = np.asarray(query_embedding, dtype=np.float32)
+            candidates = []
+            for msg in context.messages:
+                # Skip system messages (instructions always relevant)
+                if msg.role == "system" or msg.embedding is None:
+                    continue
+                if len(msg.embedding) != query.shape[0]:
+                    # PATTERN: Fail-safe - keep message on error
+                    logger.warning(
+                        f"Failed to compute similarity for message {msg.id}: "
+                        "Vectors must have same shape"
+                    )
+                    continue
+                candidates.append(msg)
+
+            if candidates:
+                # PATTERN: One (N, D) @ (D,) matmul instead of N cosine calls.
+                # Unit embeddings are normalized once per message and cached,
+                # so only the query needs normalizing here.
+                matrix = np.stack([msg.unit_embedding for msg in candidates])
+                query = normalize(query)
+                sims = matrix @ query
+                # Negative similarity counts as 0.0, same as cosine_similarity
+                below = np.maximum(sims, 0.0) < self.threshold
+                to_remove = [msg.id for msg in compress(candidates, below)]
 
         # STEP 2: Ensure at least one non-system message remains
         # This prevents catastrophic pruning when query is off-topic
+        remove_ids = set(to_remove)
         non_system_messages = [m for m in context.messages if m.role != "system"]
-        non_system_ids = {m.id for m in non_system_messages}
 
         # Check if we would remove all non-system messages
-        if non_system_ids and non_system_ids.issubset(set(to_remove)):
+        if non_system_messages and all(m.id in remove_ids for m in non_system_messages):
             # Keep the most recent non-system message as anchor
             most_recent = max(non_system_messages, key=lambda m: m.turn_index)
-            to_remove.remove(most_recent.id)
+            remove_ids.discard(most_recent.id)
             logger.warning(
                 "Semantic pruning would remove all non-system messages, "
                 f"keeping most recent: turn={most_recent.turn_index}"
             )
 
         # STEP 3: Remove filtered messages (IMMUTABLE PATTERN)
-        for msg_id in to_remove:
-            context.remove_message(msg_id)
+        # PATTERN: Rebuild the list once instead of one remove_message() per id,
+        # each of which shifts the tail of the list
+        if remove_ids:
+            context.messages = [m for m in context.messages if m.id not in remove_ids]
 
         return context, state
 
     def should_apply(self, context: ContextWindow, state: TurnState) -> bool:
-        """Apply only if messages have embeddings.
+        """Apply only if the query and at least one message have embeddings.
 
         PATTERN: Conditional execution based on prerequisites
-        Don't run if embeddings aren't available.
+        Don't run if embeddings aren't available. The O(1) query check runs
+        first so the message scan is skipped when there is nothing to compare.
 
         Args:
             context: Context window
             state: Turn state
 
         Returns:
-            True if any message has embeddings
+            True if the query and any message have embeddings
         """
-        return any(msg.embedding is not None for msg in context.messages)
+        return state.user_embedding is not None and any(
+            msg.embedding is not None for msg in context.messages
+        )
@@ -32,7 +32,7 @@ WHEN NOT TO USE:
 
 PERFORMANCE NOTES:
 - First call: Expensive (embed all tools)
-- Subsequent calls: Fast (cached embeddings)
+- Subsequent calls: Fast (cached embeddings, shared across instances)
 - Trade-off: Memory (cache) vs CPU (re-embedding)
 
 CUSTOMIZATION IDEAS:
@@ -42,14 +42,67 @@ CUSTOMIZATION IDEAS:
 - Adaptive max_tools based on token budget
 """
 
-from typing import Any
+import threading
+from collections import OrderedDict
+from typing import Any, cast
 
 import numpy as np
 
 from textile.core.context_window import ContextWindow
 from textile.core.turn_state import TurnState
 from textile.transformers.base import ContextTransformer
-from textile.utils.similarity import cosine_similarity
+from textile.utils import normalize
+
+# Maximum number of encoded queries kept when state has no user_embedding
+QUERY_CACHE_SIZE = 1024
+
+# Maximum number of tool embeddings kept in the process-wide cache
+TOOL_CACHE_SIZE = 4096
+
+
+class _LRUCache:
+    """Small least-recently-used cache, safe to share between threads.
+
+    PATTERN: One lock around each get/put - acompletion runs transform() in
+    worker threads, so caches may be touched concurrently.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[Any, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> np.ndarray | None:
+        with self._lock:
+            if (value := self._data.get(key)) is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Any, value: np.ndarray) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# PATTERN: Process-wide, content-keyed cache
+# Keyed by (embedding model, embedded text), so new transformer instances reuse
+# earlier work and an edited tool description is re-embedded instead of
+# returning a stale vector for the same tool name.
+_tool_embedding_cache = _LRUCache(TOOL_CACHE_SIZE)
+
+
+def _model_key(model: Any) -> Any:
+    """Identify an embedding model for cache keys.
+
+    Named models (e.g. Embedding) share entries across instances; any other
+    model is keyed by the instance itself, which the key keeps alive.
+    """
+    return (type(model).__qualname__, getattr(model, "model", model))
 
 
 class SemanticToolSelectionTransformer(ContextTransformer):
@@ -86,8 +139,10 @@ class SemanticToolSelectionTransformer(ContextTransformer):
         self.threshold = similarity_threshold
         self.cache_embeddings = cache_embeddings
 
-        # PATTERN: Instance-level cache for expensive operations
-        self._embedding_cache: dict[str, np.ndarray] = {}
+        self._query_cache = _LRUCache(QUERY_CACHE_SIZE)
+        # (matrix key, matrix) kept as one tuple so concurrent readers never
+        # pair one thread's key with another thread's matrix
+        self._last_matrix: tuple[tuple[Any, tuple[str, ...]], np.ndarray] | None = None
 
     def transform(
         self,
@@ -98,8 +153,8 @@ class SemanticToolSelectionTransformer(ContextTransformer):
 
         IMPLEMENTATION PATTERN:
         1. Get tools from state (not context!)
-        2. Embed tool descriptions (with caching)
-        3. Compute similarity to query
+        2. Embed tool descriptions (cached, one batch for misses, unit-normalized)
+        3. Compute similarity to query (one matrix-vector product)
         4. Filter by threshold and top-k
         5. Return new state with filtered tools
 
@@ -120,9 +175,6 @@ class SemanticToolSelectionTransformer(ContextTransformer):
         if not tools:
             return context, state
 
-        query_embedding = state.user_embedding
-        tool_scores: list[tuple[dict[str, Any], float]] = []
-
         # PATTERN: Check configuration early, fail fast
         from textile.config import get_config
 
@@ -133,32 +185,39 @@ class SemanticToolSelectionTransformer(ContextTransformer):
                 "Configure via: textile.configure(embedding_model=Embedding('text-embedding-3-small'))"
             )
 
-        # STEP 1: Score each tool
+        # PATTERN: Reuse the query embedding when the caller already has one
+        # Only encode the user message when state carries no embedding
+        if state.user_embedding is not None:
+            query = normalize(state.user_embedding)
+        else:
+            query = self._encode_query(config.embedding_model, state.user_message)
+
+        # STEP 1: Collect the function tools and the text embedded for each
+        function_tools: list[dict[str, Any]] = []
+        tool_texts: list[str] = []
         for tool in tools:
             if tool.get("type") == "function":
                 func = tool.get("function", {})
-                tool_name = func.get("name", "")
-                tool_desc = func.get("description", "")
-                tool_text = f"{tool_name}: {tool_desc}"
-
-                # PATTERN: Caching expensive operations
-                if self.cache_embeddings and tool_name in self._embedding_cache:
-                    tool_embedding = self._embedding_cache[tool_name]
-                else:
-                    tool_embedding = config.embedding_model.encode(tool_text)
-
-                    if self.cache_embeddings:
-                        self._embedding_cache[tool_name] = tool_embedding
-
-                similarity = cosine_similarity(query_embedding, tool_embedding)
-
-                # Only consider tools above threshold
-                if similarity >= self.threshold:
-                    tool_scores.append((tool, similarity))
-
-        # STEP 2: Sort by similarity and take top-k
-        tool_scores.sort(key=lambda x: x[1], reverse=True)
-        selected_tools = [tool for tool, _ in tool_scores[: self.max_tools]]
+                tool_texts.append(f"{func.get('name', '')}: {func.get('description', '')}")
+                function_tools.append(tool)
+
+        # STEP 2: Score all tools with one matrix-vector product
+        # PATTERN: (N, D) @ (D,) in a single BLAS call instead of N cosine calls
+        selected_tools: list[dict[str, Any]] = []
+        if function_tools:
+            matrix = self._tool_matrix(config.embedding_model, tool_texts)
+            scores = np.clip(matrix @ query, 0.0, 1.0)
+
+            # PATTERN: Partial selection - O(N) partition, then sort only the top-k
+            # Candidates include every tie with the k-th score, and the stable
+            # sort keeps ties in catalog order.
+            k = min(self.max_tools, len(function_tools))
+            candidates = np.arange(len(function_tools))
+            if k < len(function_tools):
+                kth_score = np.partition(scores, -k)[-k]
+                candidates = np.flatnonzero(scores >= kth_score)
+            order = candidates[np.argsort(-scores[candidates], kind="stable")[:k]]
+            selected_tools = [function_tools[i] for i in order if scores[i] >= self.threshold]
 
         # STEP 3: Track metrics in message metadata (for observability)
         if context.messages:
@@ -176,6 +235,78 @@ class SemanticToolSelectionTransformer(ContextTransformer):
         new_state = replace(state, tools=selected_tools)
         return context, new_state
 
+    def _tool_matrix(self, model: Any, tool_texts: list[str]) -> np.ndarray:
+        """Return the (N, D) matrix of unit tool embeddings, one row per text.
+
+        PATTERN: Reuse the stacked matrix while the catalog is unchanged
+        Agents usually send the same tools every turn, so the last matrix is
+        kept and the per-tool lookups and stacking only rerun when the tool
+        texts (or the embedding model) change.
+
+        Args:
+            model: Configured embedding model
+            tool_texts: Text embedded for each function tool, in catalog order
+
+        Returns:
+            Matrix of L2-normalized embeddings
+        """
+        model_key = _model_key(model)
+        matrix_key = (model_key, tuple(tool_texts))
+        if self.cache_embeddings and (last := self._last_matrix) is not None:
+            last_key, last_matrix = last
+            if last_key == matrix_key:
+                return last_matrix
+
+        rows: list[np.ndarray | None] = []
+        missing: list[int] = []
+        missing_texts: list[str] = []
+        for tool_text in tool_texts:
+            # PATTERN: Caching expensive operations
+            # Cached vectors are already normalized, so scoring is a dot product
+            cached = (
+                _tool_embedding_cache.get((model_key, tool_text)) if self.cache_embeddings else None
+            )
+            if cached is None:
+                missing.append(len(rows))
+                missing_texts.append(tool_text)
+            rows.append(cached)
+
+        # PATTERN: One batched encode call for all cache misses
+        # Remote embedding APIs cost one round-trip per call, not per text
+        if missing_texts:
+            encoded = model.encode_batch(missing_texts)
+            for row_index, tool_text, tool_embedding in zip(
+                missing, missing_texts, encoded, strict=True
+            ):
+                unit = normalize(tool_embedding)
+                rows[row_index] = unit
+                if self.cache_embeddings:
+                    _tool_embedding_cache.put((model_key, tool_text), unit)
+
+        matrix = np.stack(cast(list[np.ndarray], rows))
+        if self.cache_embeddings:
+            self._last_matrix = (matrix_key, matrix)
+        return matrix
+
+    def _encode_query(self, model: Any, text: str) -> np.ndarray:
+        """Encode and normalize the user message, with a bounded LRU cache.
+
+        Args:
+            model: Configured embedding model
+            text: User message to encode
+
+        Returns:
+            L2-normalized query embedding
+        """
+        key = (_model_key(model), text)
+        if self.cache_embeddings and (cached := self._query_cache.get(key)) is not None:
+            return cached
+
+        query = normalize(model.encode(text))
+        if self.cache_embeddings:
+            self._query_cache.put(key, query)
+        return query
+
     def should_apply(self, context: ContextWindow, state: TurnState) -> bool:
         """Apply only if tools exceed threshold.
 
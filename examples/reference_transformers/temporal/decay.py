@@ -37,7 +37,9 @@ CUSTOMIZATION IDEAS:
 - Implement adaptive half-life based on conversation length
 """
 
+import heapq
 import logging
+from itertools import compress
 
 from textile.core.context_window import ContextWindow
 from textile.core.turn_state import TurnState
@@ -45,6 +47,9 @@ from textile.transformers.base import ContextTransformer
 
 logger = logging.getLogger(__name__)
 
+# Ages beyond this fall back to computing the decay factor directly
+DECAY_TABLE_SIZE = 4096
+
 
 class DecayTransformer(ContextTransformer):
     """Apply exponential decay and prune low-prominence messages.
@@ -72,6 +77,8 @@ class DecayTransformer(ContextTransformer):
         """
         if not 0.0 <= threshold <= 1.0:
             raise ValueError(f"threshold must be between 0.0 and 1.0, got {threshold}")
+        if half_life_turns <= 0:
+            raise ValueError(f"half_life_turns must be positive, got {half_life_turns}")
         if min_recent_messages < 1:
             raise ValueError(f"min_recent_messages must be >= 1, got {min_recent_messages}")
 
@@ -79,6 +86,11 @@ class DecayTransformer(ContextTransformer):
         self.threshold = threshold
         self.min_recent_messages = min_recent_messages
 
+        # PATTERN: Precompute decay factors by integer age
+        # Ages are whole turns, so 0.5^(age / half_life) is a table lookup
+        # instead of a pow() per message per turn.
+        self._decay_table = [0.5 ** (age / self.half_life) for age in range(DECAY_TABLE_SIZE)]
+
     def transform(
         self,
         context: ContextWindow,
@@ -103,80 +115,123 @@ class DecayTransformer(ContextTransformer):
         current_turn = state.turn_index
         initial_count = len(context.messages)
 
+        # PATTERN: Lazy %-formatting - arguments are only formatted when a
+        # handler actually emits the record
         logger.debug(
-            f"DecayTransformer: BEFORE transform - {initial_count} messages, "
-            f"turn_index={current_turn}, half_life={self.half_life}, threshold={self.threshold}"
+            "DecayTransformer: BEFORE transform - %d messages, "
+            "turn_index=%d, half_life=%s, threshold=%s",
+            initial_count,
+            current_turn,
+            self.half_life,
+            self.threshold,
         )
 
-        # STEP 1: Apply decay to all messages
+        # STEP 1: Apply decay, classify and threshold in a single pass
         # Note: This mutates message metadata, which is acceptable
         # The transformer protocol requires immutable ContextWindow, not Message
-        for msg in context.messages:
+        # PATTERN: Fused loop - each message is visited once, and system
+        # messages are always kept (never remove instructions)
+        # PATTERN: Check the log level once - per-message debug lines are
+        # only built when someone will read them
+        # PATTERN: Positional keep mask - one bool per message instead of
+        # hashing message ids into a set and probing it again when filtering
+        # PATTERN: Running best - track the most prominent non-system message
+        # during this pass so the fail-safe below needs no extra max() scan
+        debug = logger.isEnabledFor(logging.DEBUG)
+        messages = context.messages
+        keep: list[bool] = []
+        non_system_positions: list[int] = []
+        best_position = -1
+        best_prominence = float("-inf")
+        for position, msg in enumerate(messages):
             age_turns = current_turn - msg.turn_index
-            decay_factor = 0.5 ** (age_turns / self.half_life)
+            if 0 <= age_turns < DECAY_TABLE_SIZE:
+                decay_factor = self._decay_table[age_turns]
+            else:
+                decay_factor = 0.5 ** (age_turns / self.half_life)
             old_prominence = msg.metadata.prominence
-            msg.metadata.prominence *= decay_factor
+            prominence = old_prominence * decay_factor
+            msg.metadata.prominence = prominence
+
+            if debug:
+                logger.debug(
+                    "  Message turn=%d, age=%d, role=%s, prominence: %.3f -> %.3f, "
+                    "content_preview=%r...",
+                    msg.turn_index,
+                    age_turns,
+                    msg.role,
+                    old_prominence,
+                    prominence,
+                    msg.content[:50],
+                )
 
+            if msg.role == "system":
+                keep.append(True)
+                continue
+            non_system_positions.append(position)
+            if prominence > best_prominence:
+                best_position, best_prominence = position, prominence
+            # STEP 2: Keep non-system messages above threshold
+            keep.append(prominence >= self.threshold)
+
+        # PATTERN: Short-circuit - system messages are always kept, so with no
+        # more non-system messages than the min_recent guarantee nothing can be
+        # pruned; skip the selection work. Decay is still applied above so
+        # prominence stays consistent.
+        if len(non_system_positions) <= self.min_recent_messages:
             logger.debug(
-                f"  Message turn={msg.turn_index}, age={age_turns}, "
-                f"role={msg.role}, prominence: {old_prominence:.3f} -> {msg.metadata.prominence:.3f}, "
-                f"content_preview={msg.content[:50]!r}..."
+                "DecayTransformer: %d non-system messages <= min_recent_messages=%d, keeping all",
+                len(non_system_positions),
+                self.min_recent_messages,
             )
+            return context, state
 
-        # STEP 2: Always keep system messages (never remove instructions)
-        messages_to_keep = {msg.id for msg in context.messages if msg.role == "system"}
-
-        # STEP 3: Keep non-system messages above threshold
-        non_system_above_threshold = [
-            msg
-            for msg in context.messages
-            if msg.role != "system" and msg.metadata.prominence >= self.threshold
-        ]
-        messages_to_keep.update(msg.id for msg in non_system_above_threshold)
-
-        # STEP 4: Ensure we keep minimum recent messages for context continuity
+        # STEP 3: Ensure we keep minimum recent messages for context continuity
         # This prevents catastrophic forgetting - always maintain basic context
-        non_system_messages = [msg for msg in context.messages if msg.role != "system"]
-        non_system_messages.sort(key=lambda m: m.turn_index, reverse=True)
+        # PATTERN: Top-k selection - heapq.nlargest is O(N log k) instead of
+        # sorting every message, and orders ties the same way sorted() does
+        recent_positions = heapq.nlargest(
+            self.min_recent_messages, non_system_positions, key=lambda i: messages[i].turn_index
+        )
 
         # Guarantee the last N messages are kept
-        for i, msg in enumerate(non_system_messages):
-            if i < self.min_recent_messages:
-                if msg.id not in messages_to_keep:
-                    messages_to_keep.add(msg.id)
-                    logger.debug(
-                        f"  Added recent message (min_recent guarantee): turn={msg.turn_index}, "
-                        f"prominence={msg.metadata.prominence:.3f}"
-                    )
-            else:
-                break
-
-        # STEP 5: Ensure at least one non-system message (fail-safe)
-        if non_system_messages and not any(
-            msg.id in messages_to_keep for msg in non_system_messages
-        ):
-            best = max(non_system_messages, key=lambda m: m.metadata.prominence)
-            messages_to_keep.add(best.id)
-            logger.debug(
-                f"  No messages kept, keeping best: prominence={best.metadata.prominence:.3f}"
-            )
+        for position in recent_positions:
+            if not keep[position]:
+                keep[position] = True
+                msg = messages[position]
+                logger.debug(
+                    "  Added recent message (min_recent guarantee): turn=%d, prominence=%.3f",
+                    msg.turn_index,
+                    msg.metadata.prominence,
+                )
 
-        # STEP 6: Filter messages (IMMUTABLE PATTERN - create new list)
-        filtered_messages = [msg for msg in context.messages if msg.id not in messages_to_keep]
-        context.messages = [msg for msg in context.messages if msg.id in messages_to_keep]
+        # STEP 4: Ensure at least one non-system message (fail-safe)
+        if non_system_positions and not any(keep[i] for i in non_system_positions):
+            keep[best_position] = True
+            logger.debug("  No messages kept, keeping best: prominence=%.3f", best_prominence)
+
+        # STEP 5: Filter messages (IMMUTABLE PATTERN - create new list)
+        # PATTERN: Select with the mask via itertools.compress (C-level);
+        # filtered messages are only collected when they are going to be logged
+        context.messages = list(compress(messages, keep))
+        filtered_messages = (
+            [msg for msg, kept in zip(messages, keep, strict=True) if not kept] if debug else []
+        )
 
         logger.debug(
-            f"DecayTransformer: AFTER transform - {len(context.messages)} messages kept, "
-            f"{len(filtered_messages)} filtered"
+            "DecayTransformer: AFTER transform - %d messages kept, %d filtered",
+            len(context.messages),
+            initial_count - len(context.messages),
         )
 
-        if filtered_messages:
-            for msg in filtered_messages:
-                logger.debug(
-                    f"  FILTERED: turn={msg.turn_index}, role={msg.role}, "
-                    f"prominence={msg.metadata.prominence:.3f}, "
-                    f"content={msg.content[:50]!r}..."
-                )
+        for msg in filtered_messages:
+            logger.debug(
+                "  FILTERED: turn=%d, role=%s, prominence=%.3f, content=%r...",
+                msg.turn_index,
+                msg.role,
+                msg.metadata.prominence,
+                msg.content[:50],
+            )
 
         return context, state
 
@@ -1,5 +1,7 @@
 """Concise ContextWindow tests."""
 
+from unittest.mock import Mock, patch
+
 import pytest
 
 from textile.core.context_window import ContextWindow
@@ -53,6 +55,32 @@ class TestRemoveMessage:
     def test_remove_nonexistent_message(self, sample_context_window: ContextWindow) -> None:
         assert sample_context_window.remove_message("nonexistent") is False
 
+    def test_remove_preserves_order_and_lookups(self) -> None:
+        messages = [Message(role="user", content=str(i)) for i in range(5)]
+        cw = ContextWindow(messages=list(messages), max_tokens=100)
+        assert cw.remove_message(messages[1].id) is True
+        assert [m.content for m in cw.messages] == ["0", "2", "3", "4"]
+        assert cw.get_message_by_id(messages[4].id) is messages[4]
+        assert cw.get_message_by_id(messages[1].id) is None
+
+    def test_remove_leaves_callers_list_untouched(self) -> None:
+        messages = [Message(role="user", content=str(i)) for i in range(3)]
+        cw = ContextWindow(messages=messages, max_tokens=100)
+        assert cw.remove_message(messages[1].id) is True
+        assert len(messages) == 3 and len(cw.messages) == 2
+
+    def test_remove_deletes_every_duplicate_id(self) -> None:
+        messages = [Message(role="user", content=str(i)) for i in range(4)]
+        messages[3].id = messages[1].id
+        cw = ContextWindow(messages=list(messages), max_tokens=100)
+        assert cw.get_message_by_id(messages[1].id) is messages[1]
+
+        assert cw.remove_message(messages[1].id) is True
+        assert [m.content for m in cw.messages] == ["0", "2"]
+        assert cw.get_message_by_id(messages[1].id) is None
+        assert cw.get_message_by_id(messages[2].id) is messages[2]
+        assert cw.remove_message(messages[1].id) is False
+
 
 class TestGetMessage:
     def test_get_message_by_id(self, sample_context_window: ContextWindow) -> None:
@@ -62,6 +90,14 @@ class TestGetMessage:
     def test_get_nonexistent_message(self, sample_context_window: ContextWindow) -> None:
         assert sample_context_window.get_message_by_id("nonexistent") is None
 
+    def test_lookup_after_direct_mutation(self, sample_context_window: ContextWindow) -> None:
+        first = sample_context_window.messages[0]
+        assert sample_context_window.get_message_by_id(first.id) is first
+        added = Message(role="user", content="direct")
+        sample_context_window.messages = [added] + sample_context_window.messages[1:]
+        assert sample_context_window.get_message_by_id(added.id) is added
+        assert sample_context_window.get_message_by_id(first.id) is None
+
     @pytest.mark.parametrize("role,expected_count", [("user", 1), ("assistant", 1), ("system", 0)])
     def test_get_messages_by_role(
         self, sample_context_window: ContextWindow, role: str, expected_count: int
@@ -89,3 +125,16 @@ class TestTokenCounting:
 
     def test_total_tokens_empty(self, empty_context_window: ContextWindow) -> None:
         assert empty_context_window.total_tokens() >= 0
+
+    def test_total_tokens_counts_in_place_tool_call_edits(self) -> None:
+        tool_calls = [{"id": "call_1", "type": "function", "function": {"name": "a"}}]
+        message = Message(role="assistant", content="", tool_calls=tool_calls)
+        cw = ContextWindow(messages=[message], max_tokens=100)
+        counter = Mock(return_value=7)
+        with patch("textile.core.context_window._count_tokens", counter):
+            cw.total_tokens()
+            tool_calls.append({"id": "call_2", "type": "function", "function": {"name": "b"}})
+            cw.total_tokens()
+
+        assert counter.call_count == 2
+        assert len(counter.call_args.kwargs["messages"][0]["tool_calls"]) == 2
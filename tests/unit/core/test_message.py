@@ -41,6 +41,13 @@ class TestMessageCreation:
         assert msg1.id != msg2.id
         assert msg1.id.startswith("msg_")
 
+    def test_ids_are_random_not_sequential(self) -> None:
+        ids = [Message(role="user", content="test").id for _ in range(1000)]
+        assert len(set(ids)) == 1000
+        assert all(len(msg_id) == len("msg_") + 16 for msg_id in ids)
+        # A process-local counter would repeat the same low ids in every worker
+        assert not any(msg_id.startswith("msg_00000000") for msg_id in ids)
+
     def test_default_metadata_created(self) -> None:
         msg = Message(role="user", content="test")
         assert isinstance(msg.metadata, MessageMetadata)
@@ -1,5 +1,8 @@
 """Concise MessageMetadata tests."""
 
+from dataclasses import dataclass, field
+
+import numpy as np
 import pytest
 
 from textile.core.metadata import DataclassMetadata, MessageMetadata
@@ -40,6 +43,37 @@ class TestGlobalProperties:
         meta.embedding = embedding
         assert meta.embedding == embedding
 
+    def test_embedding_stores_array_without_conversion(self) -> None:
+        meta = MessageMetadata()
+        embedding = np.ones(4, dtype=np.float32)
+        meta.embedding = embedding
+        assert meta.embedding is embedding
+
+    def test_unit_embedding_is_normalized(self) -> None:
+        meta = MessageMetadata()
+        meta.embedding = [3.0, 4.0]
+        np.testing.assert_allclose(meta.unit_embedding, [0.6, 0.8], rtol=1e-6)
+        assert meta.unit_embedding.dtype == np.float32
+
+    def test_unit_embedding_cached_until_reassigned(self) -> None:
+        meta = MessageMetadata()
+        meta.embedding = [3.0, 4.0]
+        first = meta.unit_embedding
+        assert meta.unit_embedding is first
+        meta.embedding = [0.0, 2.0]
+        np.testing.assert_allclose(meta.unit_embedding, [0.0, 1.0])
+
+    @pytest.mark.parametrize("embedding,expected", [(None, None), ([0.0, 0.0], [0.0, 0.0])])
+    def test_unit_embedding_edge_cases(
+        self, embedding: list[float] | None, expected: list[float] | None
+    ) -> None:
+        meta = MessageMetadata()
+        meta.embedding = embedding
+        if expected is None:
+            assert meta.unit_embedding is None
+        else:
+            np.testing.assert_array_equal(meta.unit_embedding, expected)
+
 
 class TestNamespaces:
     def test_set_and_get_namespace(self, sample_metadata: MessageMetadata) -> None:
@@ -74,6 +108,26 @@ class TestNamespaces:
         assert sample_metadata.has_namespace("test")
 
 
+class TestDataclassMetadata:
+    def test_to_dict_roundtrip(self) -> None:
+        @dataclass
+        class TestMeta(DataclassMetadata):
+            score: float = 0.5
+            tags: list[str] = field(default_factory=list)
+
+        meta = TestMeta(score=0.9, tags=["a"])
+        assert meta.to_dict() == {"score": 0.9, "tags": ["a"]}
+        assert TestMeta.from_dict(meta.to_dict()) == meta
+
+    def test_to_dict_is_shallow(self) -> None:
+        @dataclass
+        class TestMeta(DataclassMetadata):
+            tags: list[str] = field(default_factory=list)
+
+        meta = TestMeta(tags=["a"])
+        assert meta.to_dict()["tags"] is meta.tags
+
+
 class TestSerialization:
     def test_to_dict_includes_global(self) -> None:
         meta = MessageMetadata()
@@ -91,3 +145,30 @@ class TestSerialization:
         meta.turn_index = 3
         restored = MessageMetadata.from_dict(meta.to_dict())
         assert restored.prominence == 0.9 and restored.turn_index == 3
+
+    def test_roundtrip_preserves_raw_keys(self) -> None:
+        meta = MessageMetadata()
+        meta._set_raw("selected_tools", ["search"])
+        restored = MessageMetadata.from_dict(meta.to_dict())
+        assert restored._get_raw("selected_tools") == ["search"]
+
+
+class TestRawAccess:
+    def test_raw_access_maps_global_properties(self) -> None:
+        meta = MessageMetadata()
+        meta._set_raw("turn_index", 4)
+        assert meta.turn_index == 4 and meta._get_raw("turn_index") == 4
+
+    def test_contains(self) -> None:
+        meta = MessageMetadata()
+        assert meta._contains("prominence")
+        assert not meta._contains("flag")
+        meta._set_raw("flag", True)
+        assert meta._contains("flag")
+
+    def test_uses_slots(self) -> None:
+        assert not hasattr(MessageMetadata(), "__dict__")
+
+    def test_raw_access_coerces_global_types(self) -> None:
+        meta = MessageMetadata.from_dict({"global": {"prominence": 1, "turn_index": 2.0}})
+        assert type(meta.prominence) is float and type(meta.turn_index) is int
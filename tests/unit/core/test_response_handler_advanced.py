@@ -82,6 +82,17 @@ class TestBoundaryLogic:
         result = handler._adjust_for_partial_pattern(boundary, compiled)
         assert result >= expected_ge or result == boundary
 
+    def test_prefix_guided_adjustment_matches_full_scan(self) -> None:
+        pattern = OnPattern(re.compile(r"<ID_\d+>"), "X")
+        handler = StreamingResponseHandler([pattern])
+        handler.buffer = "x <ID_12> y <ID_345><ID_6> z" * 3
+        compiled = pattern.pattern
+        assert isinstance(compiled, re.Pattern)
+        for boundary in range(len(handler.buffer) + 1):
+            assert handler._adjust_for_partial_pattern(
+                boundary, compiled, "<ID_"
+            ) == handler._adjust_for_partial_pattern(boundary, compiled)
+
 
 class TestApplyPatternsEdgeCases:
     def test_apply_patterns_empty_list(self) -> None:
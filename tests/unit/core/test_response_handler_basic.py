@@ -58,6 +58,19 @@ class TestTransformChunk:
         handler.transform_chunk("A" * 60)
         assert handler.get_stats()["chunks_processed"] == 1
 
+    @pytest.mark.parametrize("text", ["word " * 20000, "[" + "open " * 20000])
+    def test_buffer_stays_bounded(self, text: str) -> None:
+        # The retained buffer never grows with the stream, so appending a chunk
+        # copies a bounded amount and a long stream costs linear time overall
+        handler = StreamingResponseHandler(
+            [OnPattern(re.compile(r"\[[a-z ]*\]"), "[REDACTED]")], max_buffer_size=1000
+        )
+        peak = 0
+        for char in text:
+            handler.transform_chunk(char)
+            peak = max(peak, len(handler.buffer))
+        assert peak <= 1000 + 1
+
 
 class TestPatternApplication:
     def test_multiple_patterns_sequential(self) -> None:
@@ -80,6 +93,63 @@ class TestPatternApplication:
         result = handler.flush()
         assert "redacted_123" in result or "redacted_456" in result
 
+    def test_literal_and_regex_paths_agree(self) -> None:
+        literal = StreamingResponseHandler([OnPattern("a.b", "X", max_replacements=2)])
+        regex = StreamingResponseHandler([OnPattern(re.compile(r"a\.b"), "X", max_replacements=2)])
+        text = "a.b axb a.b a.b"
+        assert literal._apply_patterns(text) == regex._apply_patterns(text) == "X axb X a.b"
+        assert literal.get_stats()["patterns_applied"] == regex.get_stats()["patterns_applied"]
+
+    @pytest.mark.parametrize("max_replacements,expected", [(-1, 2), (1, 1), (0, 0)])
+    def test_regex_string_replacement_is_literal(
+        self, max_replacements: int, expected: int
+    ) -> None:
+        pattern = OnPattern(re.compile(r"<(\w+)>"), r"\1\g<0>", max_replacements=max_replacements)
+        handler = StreamingResponseHandler([pattern])
+        result = handler._apply_patterns("<a> <b>")
+        assert result.count(r"\1\g<0>") == expected
+        assert handler.get_stats()["patterns_applied"] == expected
+
+    def test_regex_stream_matches_whole_text(self, regex_pattern: OnPattern) -> None:
+        handler = StreamingResponseHandler([regex_pattern])
+        text = "".join(f"row {i} <PHONE_{i}> plain " for i in range(100))
+        out = [handler.transform_chunk(text[i : i + 5]) for i in range(0, len(text), 5)]
+        expected = re.sub(r"<PHONE_(\d+)>", r"redacted_\1", text)
+        assert "".join(out) + handler.flush() == expected
+
+    def test_no_patterns_passes_chunks_through(self) -> None:
+        handler = StreamingResponseHandler([])
+        assert handler.transform_chunk("hi") == "hi"
+        assert handler.flush() == "" and handler.get_stats()["chunks_processed"] == 1
+
+    def test_long_stream_split_markers(self) -> None:
+        handler = StreamingResponseHandler([OnPattern("<PHONE>", "555-1234")])
+        text = "".join(f"line {i} <PHONE> " for i in range(200))
+        out = [handler.transform_chunk(text[i : i + 7]) for i in range(0, len(text), 7)]
+        result = "".join(out) + handler.flush()
+        assert result == text.replace("<PHONE>", "555-1234")
+
+
+class TestTransformText:
+    def test_matches_chunked_result(self, regex_pattern: OnPattern) -> None:
+        patterns = [OnPattern("<PHONE>", "555-1234"), regex_pattern]
+        text = "".join(f"row {i} <PHONE> <PHONE_{i}> " for i in range(100))
+        chunked = StreamingResponseHandler(patterns)
+        expected = chunked.transform_chunk(text) + chunked.flush()
+        handler = StreamingResponseHandler(patterns)
+        assert handler.transform_text(text) == expected and handler.buffer == ""
+        assert handler.get_stats()["patterns_applied"] == 200
+
+    def test_empty_text(self, handler: StreamingResponseHandler) -> None:
+        assert handler.transform_text("") == ""
+
+    def test_match_longer_than_threshold_is_not_split(self) -> None:
+        handler = StreamingResponseHandler([OnPattern(re.compile(r"\[[a-z ]*\]"), "[REDACTED]")])
+        text = "hello [" + "secret words " * 40 + "] " + "tail " * 10
+        result = handler.transform_chunk(text) + handler.flush()
+        assert result == "hello [REDACTED] " + "tail " * 10
+        assert "secret" not in result
+
 
 class TestFlush:
     def test_flush_empty_buffer(self, handler: StreamingResponseHandler) -> None:
@@ -88,3 +158,17 @@ class TestFlush:
     def test_flush_processes_buffer(self, handler: StreamingResponseHandler) -> None:
         handler.transform_chunk("Call <PHONE>")
         assert "555-1234" in handler.flush() and handler.buffer == ""
+
+
+class TestStats:
+    def test_snapshot_is_detached_copy(self, handler: StreamingResponseHandler) -> None:
+        stats = handler.get_stats()
+        handler.transform_chunk("more")
+        assert stats["chunks_processed"] == 0
+
+    def test_live_view_is_read_only(self, handler: StreamingResponseHandler) -> None:
+        view = handler.get_stats(snapshot=False)
+        handler.transform_chunk("more")
+        assert view["chunks_processed"] == 1
+        with pytest.raises(TypeError):
+            view["errors"] = 1  # type: ignore[index]
@@ -1,6 +1,7 @@
 """Concise OnPattern tests."""
 
 import re
+from unittest.mock import patch
 
 import pytest
 
@@ -66,6 +67,13 @@ class TestCallableReplacement:
         match = re.match(r"test", "test")
         assert match is not None and pattern.get_replacement(match) == "42"
 
+    def test_arity_resolved_at_construction(self) -> None:
+        pattern = OnPattern("test", lambda m: m.group(0).upper())
+        match = re.match(r"test", "test")
+        with patch("textile.core.response_pattern.inspect.signature") as signature:
+            assert match is not None and pattern.get_replacement(match) == "TEST"
+        signature.assert_not_called()
+
 
 class TestPatternWarnings:
     def test_compiled_pattern_with_ignore_case_warns(
@@ -75,6 +83,39 @@ class TestPatternWarnings:
         assert "ignore_case=True but pattern already compiled" in caplog.text
 
 
+class TestLiteralDetection:
+    @pytest.mark.parametrize(
+        "pattern,ignore_case,expected",
+        [
+            ("a.b", False, "a.b"),
+            ("a.b", True, None),
+            ("", False, None),
+            (re.compile("a.b"), False, None),
+        ],
+    )
+    def test_literal_only_for_plain_strings(
+        self, pattern: str | re.Pattern, ignore_case: bool, expected: str | None
+    ) -> None:
+        assert OnPattern(pattern, "x", ignore_case=ignore_case)._literal == expected
+
+
+class TestLiteralPrefix:
+    @pytest.mark.parametrize(
+        "pattern,expected",
+        [
+            (re.compile(r"<PHONE_(\d+)>"), "<PHONE_"),
+            ("a.b", "a.b"),
+            (re.compile("ab?c"), "a"),
+            (re.compile("abc+"), "abc"),
+            (re.compile(r"\d+x"), ""),
+            (re.compile("x|y"), ""),
+            (re.compile("(?i)abc"), ""),
+        ],
+    )
+    def test_prefix_extraction(self, pattern: str | re.Pattern, expected: str) -> None:
+        assert OnPattern(pattern, "x")._prefix == expected
+
+
 class TestEdgeCases:
     def test_empty_string_pattern(self) -> None:
         assert isinstance(OnPattern("", "replaced").pattern, re.Pattern)
@@ -41,6 +41,9 @@ class TestTurnStateCreation:
         with pytest.raises((AttributeError, TypeError)):  # Frozen dataclass raises one of these
             state.user_message = "changed"  # type: ignore[misc]
 
+    def test_uses_slots(self) -> None:
+        assert not hasattr(TurnState(user_message="test"), "__dict__")
+
 
 class TestTurnStateDefaults:
     """Default value behavior."""
@@ -104,3 +104,59 @@ class TestLiteLLMEmbedding:
         assert result[0][0] == pytest.approx(0.0)
         assert result[1][0] == pytest.approx(0.1)
         assert result[2][0] == pytest.approx(0.2)
+
+
+class TestEmbeddingCache:
+    """Test the per-instance LRU embedding cache."""
+
+    @pytest.fixture
+    def calls(self, monkeypatch):
+        recorded = []
+
+        def counting_embedding(model, input, **kwargs):
+            recorded.append(input)
+            texts = input if isinstance(input, list) else [input]
+
+            class Response:
+                data = [{"embedding": [float(len(t))] * 4} for t in texts]
+
+            return Response()
+
+        import litellm
+
+        monkeypatch.setattr(litellm, "embedding", counting_embedding)
+        return recorded
+
+    def test_encode_hits_cache(self, calls):
+        model = Embedding(dimensions=4)
+        first = model.encode("abc")
+        first[0] = -1.0
+        assert model.encode("abc")[0] == pytest.approx(3.0)
+        assert calls == ["abc"]
+
+    def test_encode_batch_requests_only_misses(self, calls):
+        model = Embedding(dimensions=4)
+        model.encode("a")
+        result = model.encode_batch(["a", "bb", "bb", "ccc"])
+        assert calls == ["a", ["bb", "ccc"]]
+        assert result[:, 0].tolist() == [1.0, 2.0, 2.0, 3.0]
+
+    def test_least_recently_used_evicted(self, calls):
+        model = Embedding(dimensions=4, cache_size=2)
+        model.encode("a")
+        model.encode("b")
+        model.encode("a")
+        model.encode("c")
+        model.encode("a")
+        model.encode("b")
+        assert calls == ["a", "b", "c", "b"]
+
+    def test_cache_disabled(self, calls):
+        model = Embedding(dimensions=4, cache_size=0)
+        model.encode("a")
+        model.encode_batch(["a"])
+        assert calls == ["a", ["a"]]
+
+    def test_negative_cache_size_raises(self):
+        with pytest.raises(ValueError, match="cache_size"):
+            Embedding(dimensions=4, cache_size=-1)
@@ -0,0 +1,77 @@
+"""Tests for the temporal decay reference transformer."""
+
+import random
+
+import pytest
+
+from examples.reference_transformers.temporal.decay import DECAY_TABLE_SIZE, DecayTransformer
+from textile.core.context_window import ContextWindow
+from textile.core.message import Message
+from textile.core.turn_state import TurnState
+
+
+def reference_decay(messages, turn, half_life, threshold, min_recent):
+    """Straightforward version of the decay rules: apply decay, then select."""
+    for msg in messages:
+        msg.metadata.prominence *= 0.5 ** ((turn - msg.turn_index) / half_life)
+
+    keep = {m.id for m in messages if m.role == "system" or m.metadata.prominence >= threshold}
+    non_system = sorted(
+        (m for m in messages if m.role != "system"), key=lambda m: m.turn_index, reverse=True
+    )
+    keep.update(m.id for m in non_system[:min_recent])
+    if non_system and not any(m.id in keep for m in non_system):
+        keep.add(max(non_system, key=lambda m: m.metadata.prominence).id)
+    return [m for m in messages if m.id in keep]
+
+
+def make_messages(rng, count, turn):
+    messages = []
+    for i in range(count):
+        msg = Message(
+            role=rng.choice(["system", "user", "assistant", "tool"]),
+            content=f"m{i}",
+            id=f"m{i}",
+        )
+        msg.turn_index = rng.randint(0, turn + 2)
+        msg.metadata.prominence = rng.choice([1.0, rng.random()])
+        messages.append(msg)
+    return messages
+
+
+def clone(messages):
+    copies = []
+    for msg in messages:
+        copy = Message(role=msg.role, content=msg.content, id=msg.id)
+        copy.turn_index = msg.turn_index
+        copy.metadata.prominence = msg.metadata.prominence
+        copies.append(copy)
+    return copies
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_matches_reference(seed):
+    rng = random.Random(seed)
+    turn = rng.choice([5, 30, DECAY_TABLE_SIZE + 10])
+    half_life = rng.choice([1, 3, 5, 2.5])
+    threshold = rng.choice([0.0, 0.1, 0.5, 1.0])
+    min_recent = rng.randint(1, 6)
+    messages = make_messages(rng, rng.randint(0, 25), turn)
+    expected = reference_decay(clone(messages), turn, half_life, threshold, min_recent)
+
+    transformer = DecayTransformer(half_life, threshold, min_recent)
+    context, _ = transformer.transform(
+        ContextWindow(messages=messages, max_tokens=1000),
+        TurnState(user_message="", turn_index=turn),
+    )
+
+    assert [m.id for m in context.messages] == [m.id for m in expected]
+    assert [m.metadata.prominence for m in context.messages] == [
+        m.metadata.prominence for m in expected
+    ]
+
+
+@pytest.mark.parametrize("half_life", [0, -1])
+def test_rejects_non_positive_half_life(half_life):
+    with pytest.raises(ValueError, match="half_life_turns must be positive"):
+        DecayTransformer(half_life_turns=half_life)
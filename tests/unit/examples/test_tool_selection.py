@@ -0,0 +1,126 @@
+"""Tests for the semantic tool selection reference transformer."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from examples.reference_transformers.semantic import tool_selection
+from examples.reference_transformers.semantic.tool_selection import (
+    SemanticToolSelectionTransformer,
+    _LRUCache,
+)
+from textile.core.context_window import ContextWindow
+from textile.core.message import Message
+from textile.core.turn_state import TurnState
+
+VECTORS = {
+    "weather: Get the forecast": [1.0, 0.0, 0.0],
+    "email: Send an email": [0.0, 1.0, 0.0],
+    "calendar: Book a meeting": [0.0, 0.6, 0.8],
+    "search: Search the web": [0.7, 0.7, 0.0],
+    "weather: Get current conditions": [0.9, 0.0, 0.1],
+    "Will it rain tomorrow?": [1.0, 0.1, 0.0],
+    "Email Bob about lunch": [0.0, 1.0, 0.2],
+}
+
+
+class VectorEmbedding:
+    """Embedding model returning fixed vectors and counting encoded texts."""
+
+    model = "fixed-vectors"
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, text):
+        self.encoded.append(text)
+        return np.array(VECTORS[text], dtype=np.float32)
+
+    def encode_batch(self, texts):
+        return np.stack([self.encode(text) for text in texts])
+
+
+def tool(name, description):
+    return {"type": "function", "function": {"name": name, "description": description}}
+
+
+TOOLS = [
+    tool("weather", "Get the forecast"),
+    tool("email", "Send an email"),
+    tool("calendar", "Book a meeting"),
+    tool("search", "Search the web"),
+]
+
+
+@pytest.fixture(autouse=True)
+def fresh_tool_cache(monkeypatch):
+    monkeypatch.setattr(tool_selection, "_tool_embedding_cache", _LRUCache(64))
+
+
+@pytest.fixture
+def model():
+    embedding = VectorEmbedding()
+    with patch("textile.config.get_config") as mock_config:
+        mock_config.return_value.embedding_model = embedding
+        yield embedding
+
+
+def select(transformer, query, tools=TOOLS):
+    context = ContextWindow(messages=[Message(role="user", content=query)], max_tokens=1000)
+    _, state = transformer.transform(context, TurnState(user_message=query, tools=tools))
+    return [t["function"]["name"] for t in state.tools]
+
+
+class TestSelection:
+    def test_selects_most_similar_tools_in_score_order(self, model):
+        transformer = SemanticToolSelectionTransformer(max_tools=2, similarity_threshold=0.0)
+        assert select(transformer, "Will it rain tomorrow?") == ["weather", "search"]
+        assert select(transformer, "Email Bob about lunch") == ["email", "calendar"]
+
+    def test_threshold_drops_weak_matches(self, model):
+        transformer = SemanticToolSelectionTransformer(max_tools=4, similarity_threshold=0.5)
+        assert select(transformer, "Will it rain tomorrow?") == ["weather", "search"]
+
+    def test_concurrent_transforms_agree_with_sequential(self, model):
+        transformer = SemanticToolSelectionTransformer(max_tools=2, similarity_threshold=0.0)
+        queries = ["Will it rain tomorrow?", "Email Bob about lunch"] * 50
+        expected = [select(transformer, q) for q in queries[:2]] * 50
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert list(pool.map(lambda q: select(transformer, q), queries)) == expected
+
+
+class TestCaching:
+    def test_new_instance_reuses_tool_embeddings(self, model):
+        select(SemanticToolSelectionTransformer(max_tools=2), "Will it rain tomorrow?")
+        model.encoded.clear()
+        select(SemanticToolSelectionTransformer(max_tools=2), "Will it rain tomorrow?")
+        assert model.encoded == ["Will it rain tomorrow?"]
+
+    def test_edited_description_is_reembedded(self, model):
+        transformer = SemanticToolSelectionTransformer(max_tools=1, similarity_threshold=0.0)
+        select(transformer, "Will it rain tomorrow?")
+        model.encoded.clear()
+        edited = [tool("weather", "Get current conditions"), *TOOLS[1:]]
+        assert select(transformer, "Will it rain tomorrow?", edited) == ["weather"]
+        assert model.encoded == ["weather: Get current conditions"]
+
+    def test_tool_cache_evicts_least_recently_used(self, model, monkeypatch):
+        monkeypatch.setattr(tool_selection, "_tool_embedding_cache", _LRUCache(2))
+        transformer = SemanticToolSelectionTransformer(max_tools=1)
+        weather, email, calendar = TOOLS[:3]
+        for tools in ([weather, email], [weather], [calendar]):
+            select(transformer, "Will it rain tomorrow?", tools)
+
+        model.encoded.clear()
+        select(transformer, "Will it rain tomorrow?", [weather, calendar])
+        assert model.encoded == []
+        select(transformer, "Will it rain tomorrow?", [email])
+        assert model.encoded == ["email: Send an email"]
+
+    def test_cache_disabled_encodes_every_time(self, model):
+        transformer = SemanticToolSelectionTransformer(max_tools=1, cache_embeddings=False)
+        select(transformer, "Will it rain tomorrow?")
+        select(transformer, "Will it rain tomorrow?")
+        assert model.encoded.count("weather: Get the forecast") == 2
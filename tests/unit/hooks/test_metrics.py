@@ -0,0 +1,118 @@
+"""Tests for MetricsHook history bounding and running aggregates."""
+
+import pytest
+
+from textile.hooks.metrics import MetricsHook
+
+
+def record(hook, name, before, after, skipped=False):
+    hook.on_transform_start(name, before, should_apply=not skipped)
+    if not skipped:
+        hook.on_transform_end(name, after)
+
+
+def fill(hook, count):
+    """Record a deterministic mix of executions and skips across names."""
+    for i in range(count):
+        name = ("Decay", "Prune", "Tools")[i % 3]
+        record(hook, name, before=10 + i % 4, after=10, skipped=i % 5 == 0)
+
+
+def brute_force_summary(metrics):
+    executed = [m for m in metrics if not m.skipped]
+    return {
+        "total_executions": len(metrics),
+        "executed": len(executed),
+        "skipped": len(metrics) - len(executed),
+        "total_messages_removed": sum(m.messages_removed for m in metrics),
+        "avg_duration_ms": (
+            sum(m.duration_ms for m in executed) / len(executed) if executed else 0.0
+        ),
+        "transformers": {m.transformer_name for m in metrics},
+    }
+
+
+class TestHistory:
+    def test_default_keeps_everything(self):
+        hook = MetricsHook()
+        fill(hook, 50)
+        assert len(hook.get_metrics()) == 50
+
+    @pytest.mark.parametrize("history", [0, -1])
+    def test_rejects_non_positive_history(self, history):
+        with pytest.raises(ValueError, match="history must be positive"):
+            MetricsHook(history=history)
+
+    def test_drops_oldest_past_history(self):
+        hook = MetricsHook(history=7)
+        fill(hook, 40)
+        metrics = hook.get_metrics()
+        assert len(metrics) == 7
+        assert metrics[-1].messages_before == 10 + 39 % 4
+
+    @pytest.mark.parametrize("count", [5, 7, 8, 40, 101])
+    def test_aggregates_match_brute_force(self, count):
+        hook = MetricsHook(history=7)
+        fill(hook, count)
+        metrics = hook.get_metrics()
+        expected = brute_force_summary(metrics)
+
+        summary = hook.summary()
+        assert set(summary.pop("transformers")) == expected.pop("transformers")
+        assert summary["avg_duration_ms"] == pytest.approx(expected.pop("avg_duration_ms"))
+        summary.pop("avg_duration_ms")
+        assert summary == expected
+
+        for name in ("Decay", "Prune", "Tools"):
+            entries = [m for m in metrics if m.transformer_name == name]
+            assert hook.get_metrics_by_transformer(name) == entries
+            assert hook.total_messages_removed(name) == sum(m.messages_removed for m in entries)
+            assert hook.avg_duration_ms(name) == pytest.approx(
+                sum(m.duration_ms for m in entries) / len(entries) if entries else 0.0
+            )
+
+    def test_evicting_last_entry_forgets_transformer(self):
+        hook = MetricsHook(history=2)
+        record(hook, "Old", before=5, after=3)
+        record(hook, "New", before=5, after=4)
+        record(hook, "New", before=5, after=5)
+
+        assert hook.get_metrics_by_transformer("Old") == []
+        assert hook.total_messages_removed("Old") == 0
+        assert hook.avg_duration_ms("Old") == 0.0
+        assert hook.summary()["transformers"] == ["New"]
+        assert "Old" not in hook._by_name
+        assert "Old" not in hook._duration_by_name
+        assert "Old" not in hook._removed_by_name
+
+    def test_clear_resets_aggregates(self):
+        hook = MetricsHook(history=3)
+        fill(hook, 10)
+        hook.clear()
+        assert hook.summary() == brute_force_summary([]) | {"transformers": []}
+
+
+class TestIterMetrics:
+    def test_yields_retained_metrics_oldest_first(self):
+        hook = MetricsHook(history=4)
+        fill(hook, 10)
+        assert list(hook.iter_metrics()) == hook.get_metrics()
+
+    def test_empty(self):
+        assert list(MetricsHook().iter_metrics()) == []
+
+    def test_recording_while_iterating_fails_clearly(self):
+        hook = MetricsHook()
+        fill(hook, 3)
+        iterator = hook.iter_metrics()
+        next(iterator)
+        record(hook, "Decay", before=5, after=4)
+        with pytest.raises(RuntimeError, match="use get_metrics"):
+            next(iterator)
+
+    def test_get_metrics_snapshot_survives_recording(self):
+        hook = MetricsHook()
+        fill(hook, 3)
+        for metrics in hook.get_metrics():
+            record(hook, metrics.transformer_name, before=5, after=5)
+        assert len(hook.get_metrics()) == 6
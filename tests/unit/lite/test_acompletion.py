@@ -1,10 +1,12 @@
 """Tests for async acompletion() API."""
 
+import threading
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from textile.lite.completion import acompletion
+from textile.transformers.base import ContextTransformer
 
 
 @pytest.mark.parametrize("stream", [True, False])
@@ -103,3 +105,33 @@ async def test_acompletion_passthrough_streaming(sample_messages):
             mock_config.return_value.transformers = None
             result = await acompletion(model="gpt-4", messages=sample_messages, stream=True)
             assert result is not None
+
+
+async def test_acompletion_transforms_off_event_loop(sample_messages, mock_completion_response):
+    """Run sync transform() in a worker thread; prefer an atransform() override."""
+
+    class ThreadRecorder(ContextTransformer):
+        def transform(self, context, state):
+            self.thread = threading.get_ident()
+            return context, state
+
+    class NativeAsync(ContextTransformer):
+        def transform(self, context, state):
+            raise AssertionError("transform() should not be called")
+
+        async def atransform(self, context, state):
+            self.called = True
+            return context, state
+
+    recorder, native = ThreadRecorder(), NativeAsync()
+    with patch(
+        "litellm.acompletion", new_callable=AsyncMock, return_value=mock_completion_response
+    ):
+        with patch("textile.lite.completion.get_config") as mock_config:
+            mock_config.return_value.transformers = None
+            with patch("litellm.get_max_tokens", return_value=4096):
+                await acompletion(
+                    model="gpt-4", messages=sample_messages, transformers=[recorder, native]
+                )
+    assert recorder.thread != threading.get_ident()
+    assert native.called
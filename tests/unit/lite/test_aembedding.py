@@ -1,10 +1,12 @@
 """Tests for async aembedding() API."""
 
+import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from textile.lite.embeddings import aembedding
+from textile.lite.embeddings import _background_tasks, aembedding
 
 
 @pytest.mark.parametrize("input_type", ["single", "multiple"])
@@ -38,6 +40,8 @@ async def test_aembedding_storage_failure_handling(mock_embedding_response, mock
                 model="text-embedding-3-small", input="test", store_in_conversation="conv_123"
             )
             assert result == mock_embedding_response
+            while _background_tasks:
+                await asyncio.sleep(0)
 
 
 async def test_aembedding_storage_not_configured():
@@ -84,3 +88,21 @@ async def test_aembedding_metadata_extraction(mock_embedding_response):
             result = await aembedding(model="text-embedding-3-small", input="test")
             assert hasattr(result, "data")
             assert hasattr(result, "usage")
+
+
+async def test_aembedding_batch_size_gathers_and_merges():
+    """Gather sub-batches concurrently and merge results in input order."""
+
+    async def fake_aembedding(model, input, **kwargs):
+        return SimpleNamespace(
+            data=[SimpleNamespace(embedding=[float(len(t))], index=i) for i, t in enumerate(input)],
+            usage=SimpleNamespace(prompt_tokens=len(input), total_tokens=len(input)),
+        )
+
+    texts = ["a" * n for n in range(1, 6)]
+    with patch("litellm.aembedding", side_effect=fake_aembedding) as mock_llm:
+        result = await aembedding(model="text-embedding-3-small", input=texts, batch_size=2)
+        assert mock_llm.call_count == 3
+        assert [item.embedding[0] for item in result.data] == [float(n) for n in range(1, 6)]
+        assert [item.index for item in result.data] == list(range(5))
+        assert result.usage.total_tokens == 5
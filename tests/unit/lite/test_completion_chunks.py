@@ -41,3 +41,17 @@ def test_create_flush_chunk():
     assert chunk is not None
     assert chunk.choices[0].delta.content == "final content"
     assert chunk.choices[0].finish_reason is None
+    assert chunk.choices[0].index == 0 and not hasattr(chunk, "__dict__")
+
+
+@pytest.mark.parametrize(
+    "chunk",
+    [
+        SimpleNamespace(choices=None),
+        SimpleNamespace(choices=[SimpleNamespace(delta=None)]),
+        SimpleNamespace(choices=[SimpleNamespace(delta={"content": "x"})]),
+    ],
+)
+def test_extract_chunk_content_malformed(chunk):
+    """Return None for chunks that do not have the expected shape."""
+    assert _extract_chunk_content(chunk) is None
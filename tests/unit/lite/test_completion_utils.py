@@ -23,6 +23,19 @@ def test_build_trace():
     assert trace["user_message"] == "test"
     assert trace["transformers"] == ["TestTransformer"]
     assert trace["metadata"] == {"key": "value"}
+    assert trace["cached_prompt_tokens"] is None
+
+
+def test_build_trace_reports_cached_prompt_tokens():
+    """Surface provider-reported prefix cache hits."""
+    context = Mock(messages=[], max_tokens=4096)
+    state = Mock(user_message="test", metadata={})
+    details = SimpleNamespace(cached_tokens=1024)
+    response = SimpleNamespace(usage=SimpleNamespace(prompt_tokens_details=details))
+
+    assert _build_trace(context, state, [], response)["cached_prompt_tokens"] == 1024
+    response.usage.prompt_tokens_details = None
+    assert _build_trace(context, state, [], response)["cached_prompt_tokens"] is None
 
 
 def test_get_max_tokens_from_kwargs():
@@ -54,8 +67,7 @@ def test_apply_response_patterns():
 
     with patch("textile.lite.completion.StreamingResponseHandler") as mock_handler_class:
         mock_handler = Mock()
-        mock_handler.transform_chunk.return_value = "transformed"
-        mock_handler.flush.return_value = ""
+        mock_handler.transform_text.return_value = "transformed"
         mock_handler_class.return_value = mock_handler
 
         result = _apply_response_patterns(response, patterns)
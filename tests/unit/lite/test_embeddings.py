@@ -1,10 +1,17 @@
 """Tests for sync embedding() API."""
 
+import threading
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
 
-from textile.lite.embeddings import embedding
+from textile.lite.embeddings import _STORE_POOL, embedding
+
+
+def _wait_for_storage():
+    """Block until queued background storage writes have run."""
+    _STORE_POOL.submit(lambda: None).result()
 
 
 @pytest.mark.parametrize("input_type", ["single", "multiple"])
@@ -26,6 +33,7 @@ def test_embedding_with_storage_configured(mock_embedding_response, mock_sync_st
                     model="text-embedding-3-small", input="test", store_in_conversation="conv_123"
                 )
                 assert result == mock_embedding_response
+                _wait_for_storage()
                 mock_run_sync.assert_called_once()
 
 
@@ -40,6 +48,28 @@ def test_embedding_storage_failure_handling(mock_embedding_response, mock_sync_s
                     model="text-embedding-3-small", input="test", store_in_conversation="conv_123"
                 )
                 assert result == mock_embedding_response
+                _wait_for_storage()
+
+
+def test_embedding_storage_does_not_block(mock_embedding_response, mock_sync_store):
+    """Return before the storage write completes."""
+    release, finished = threading.Event(), threading.Event()
+
+    def slow_store(_):
+        release.wait(timeout=5)
+        finished.set()
+
+    with patch("litellm.embedding", return_value=mock_embedding_response):
+        with patch("textile.lite.embeddings.get_config") as mock_config:
+            mock_config.return_value._store = mock_sync_store
+            with patch("textile.lite.embeddings.run_sync", side_effect=slow_store):
+                embedding(
+                    model="text-embedding-3-small", input="test", store_in_conversation="conv_123"
+                )
+                assert not finished.is_set()
+                release.set()
+                _wait_for_storage()
+                assert finished.is_set()
 
 
 def test_embedding_storage_not_configured():
@@ -84,3 +114,38 @@ def test_embedding_metadata_extraction(mock_embedding_response):
             result = embedding(model="text-embedding-3-small", input="test")
             assert hasattr(result, "data")
             assert hasattr(result, "usage")
+
+
+def _fake_embedding(model, input, **kwargs):
+    return SimpleNamespace(
+        data=[SimpleNamespace(embedding=[float(len(t))], index=i) for i, t in enumerate(input)],
+        object="list",
+        usage=SimpleNamespace(prompt_tokens=len(input), total_tokens=len(input)),
+    )
+
+
+def test_embedding_batch_size_splits_and_merges():
+    """Split list input into sub-batches and merge results in input order."""
+    texts = ["a" * n for n in range(1, 8)]
+    with patch("litellm.embedding", side_effect=_fake_embedding) as mock_llm:
+        result = embedding(model="text-embedding-3-small", input=texts, batch_size=3)
+        assert mock_llm.call_count == 3
+        assert [item.embedding[0] for item in result.data] == [float(n) for n in range(1, 8)]
+        assert [item.index for item in result.data] == list(range(7))
+        assert result.usage.prompt_tokens == result.usage.total_tokens == 7
+
+
+@pytest.mark.parametrize("batch_size", [None, 10])
+def test_embedding_batch_size_single_request(batch_size):
+    """Send one request when no split is needed."""
+    with patch("litellm.embedding", side_effect=_fake_embedding) as mock_llm:
+        embedding(model="text-embedding-3-small", input=["a", "b"], batch_size=batch_size)
+        mock_llm.assert_called_once()
+
+
+def test_embedding_invalid_batch_size():
+    """Reject non-positive batch_size."""
+    with patch("litellm.embedding") as mock_llm:
+        with pytest.raises(ValueError, match="batch_size must be positive"):
+            embedding(model="text-embedding-3-small", input=["a"], batch_size=0)
+        mock_llm.assert_not_called()
@@ -0,0 +1,119 @@
+"""Tests for SemanticCache and its completion() integration."""
+
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from textile.lite.completion import completion
+from textile.lite.semantic_cache import SemanticCache
+
+VECTORS = {
+    "What is the weather?": [1.0, 0.0, 0.0],
+    "what is the weather": [0.99, 0.1, 0.0],
+    "Tell me a joke": [0.0, 1.0, 0.0],
+    "Hello": [0.0, 0.0, 1.0],
+}
+
+
+@pytest.fixture
+def embedding_model():
+    model = Mock()
+    model.encode.side_effect = lambda text: np.array(VECTORS[text], dtype=np.float32)
+    return model
+
+
+def _messages(text, history=()):
+    return [*history, {"role": "user", "content": text}]
+
+
+class TestSemanticCache:
+    def test_similar_query_hits(self, embedding_model):
+        cache = SemanticCache(embedding_model, threshold=0.95)
+        cache.put(cache.key("gpt-4", _messages("What is the weather?")), {"answer": "sunny"})
+        assert cache.get(cache.key("gpt-4", _messages("what is the weather"))) == {
+            "answer": "sunny"
+        }
+
+    def test_dissimilar_query_misses(self, embedding_model):
+        cache = SemanticCache(embedding_model)
+        cache.put(cache.key("gpt-4", _messages("What is the weather?")), "sunny")
+        assert cache.get(cache.key("gpt-4", _messages("Tell me a joke"))) is None
+
+    @pytest.mark.parametrize(
+        "model,history",
+        [("gpt-4o", ()), ("gpt-4", ({"role": "system", "content": "Be terse"},))],
+    )
+    def test_request_prefix_must_match(self, embedding_model, model, history):
+        cache = SemanticCache(embedding_model)
+        cache.put(cache.key("gpt-4", _messages("Hello")), "hi")
+        assert cache.get(cache.key(model, _messages("Hello", history))) is None
+
+    @pytest.mark.parametrize(
+        "last",
+        [
+            {"role": "assistant", "content": "Hello"},
+            {"role": "tool", "content": "Hello", "tool_call_id": "call_1"},
+        ],
+    )
+    def test_last_message_role_must_match(self, embedding_model, last):
+        cache = SemanticCache(embedding_model)
+        cache.put(cache.key("gpt-4", _messages("Hello")), "hi")
+        assert cache.get(cache.key("gpt-4", [last])) is None
+
+    def test_last_message_tool_call_id_must_match(self, embedding_model):
+        cache = SemanticCache(embedding_model)
+        first = {"role": "tool", "content": "Hello", "tool_call_id": "call_1"}
+        cache.put(cache.key("gpt-4", [first]), "hi")
+        assert cache.get(cache.key("gpt-4", [first])) == "hi"
+        assert cache.get(cache.key("gpt-4", [{**first, "tool_call_id": "call_2"}])) is None
+
+    def test_returns_copies(self, embedding_model):
+        cache = SemanticCache(embedding_model)
+        key = cache.key("gpt-4", _messages("Hello"))
+        cache.put(key, {"content": "hi"})
+        cache.get(key)["content"] = "changed"
+        assert cache.get(key) == {"content": "hi"}
+
+    def test_least_recently_used_replaced(self, embedding_model):
+        cache = SemanticCache(embedding_model, max_entries=2)
+        keys = {text: cache.key("gpt-4", _messages(text)) for text in VECTORS}
+        cache.put(keys["What is the weather?"], "weather")
+        cache.put(keys["Tell me a joke"], "joke")
+        cache.get(keys["What is the weather?"])
+        cache.put(keys["Hello"], "hello")
+        assert len(cache) == 2
+        assert cache.get(keys["Tell me a joke"]) is None
+        assert cache.get(keys["What is the weather?"]) == "weather"
+
+    def test_non_text_message_has_no_key(self, embedding_model):
+        cache = SemanticCache(embedding_model)
+        assert cache.key("gpt-4", [{"role": "user", "content": [{"type": "image_url"}]}]) is None
+
+    @pytest.mark.parametrize("kwargs", [{"threshold": 0.0}, {"max_entries": 0}])
+    def test_invalid_parameters(self, embedding_model, kwargs):
+        with pytest.raises(ValueError):
+            SemanticCache(embedding_model, **kwargs)
+
+
+class TestCompletionIntegration:
+    def test_second_call_served_from_cache(self, embedding_model, mock_completion_response):
+        cache = SemanticCache(embedding_model)
+        with patch("litellm.completion", return_value=mock_completion_response) as mock_llm:
+            with patch("textile.lite.completion.get_config") as mock_config:
+                mock_config.return_value.transformers = None
+                mock_config.return_value.semantic_cache = cache
+                completion(model="gpt-4", messages=_messages("What is the weather?"))
+                result = completion(model="gpt-4", messages=_messages("what is the weather"))
+                assert mock_llm.call_count == 1
+                assert result.choices[0].message.content == "Test response"
+
+    def test_streaming_bypasses_cache(self, embedding_model, mock_completion_response):
+        cache = SemanticCache(embedding_model)
+        with patch("litellm.completion", return_value=mock_completion_response) as mock_llm:
+            with patch("textile.lite.completion.get_config") as mock_config:
+                mock_config.return_value.transformers = None
+                mock_config.return_value.semantic_cache = cache
+                for _ in range(2):
+                    completion(model="gpt-4", messages=_messages("Hello"), stream=True)
+                assert mock_llm.call_count == 2 and len(cache) == 0
@@ -97,3 +97,14 @@ def test_count_tokens_message_overhead():
         messages = [{"role": "user", "content": "x"}]
         result = count_tokens(model="unknown", messages=messages)
         assert result >= 4
+
+
+def test_count_tokens_fallback_mixed_messages():
+    """Overhead applies to every message; content only to string content."""
+    with patch("textile.lite.tokens.litellm_token_counter", side_effect=Exception("No tokenizer")):
+        messages = [
+            {"role": "user", "content": "x" * 40},
+            {"role": "user", "content": "x"},
+            {"role": "assistant", "content": None, "tool_calls": []},
+        ]
+        assert count_tokens(model="unknown", messages=messages) == 10 + 1 + 3 * 4
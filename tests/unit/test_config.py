@@ -0,0 +1,48 @@
+"""Tests for global configuration."""
+
+from unittest.mock import Mock
+
+import litellm
+import pytest
+
+from textile.config import TextileConfig
+
+
+@pytest.fixture
+def outside_cache(monkeypatch):
+    """A litellm.cache installed by some other LiteLLM user."""
+    cache = Mock(name="outside_cache")
+    monkeypatch.setattr(litellm, "cache", cache)
+    return cache
+
+
+class TestCache:
+    def test_setting_cache_installs_it_in_litellm(self, outside_cache):
+        config = TextileConfig()
+        cache = Mock(name="textile_cache")
+        config.cache = cache
+        assert config.cache is cache
+        assert litellm.cache is cache
+
+    def test_clearing_cache_restores_previous_litellm_cache(self, outside_cache):
+        config = TextileConfig()
+        config.cache = Mock(name="first")
+        config.cache = Mock(name="second")
+        config.cache = None
+        assert config.cache is None
+        assert litellm.cache is outside_cache
+
+    def test_clearing_unset_cache_leaves_litellm_alone(self, outside_cache):
+        config = TextileConfig()
+        config.cache = None
+        assert litellm.cache is outside_cache
+
+    def test_reinstall_after_clear_remembers_current_cache(self, outside_cache, monkeypatch):
+        config = TextileConfig()
+        config.cache = Mock(name="first")
+        config.cache = None
+        replacement = Mock(name="replacement")
+        monkeypatch.setattr(litellm, "cache", replacement)
+        config.cache = Mock(name="second")
+        config.cache = None
+        assert litellm.cache is replacement
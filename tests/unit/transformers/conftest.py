@@ -13,11 +13,8 @@ def create_message(role: str, content: str, turn_index: int = 0, embedding=None)
     msg = Message(role=role, content=content)
     msg.turn_index = turn_index
     if embedding is not None:
-        # Convert numpy array to list for storage (like what would happen in practice)
-        if hasattr(embedding, "tolist"):
-            msg.embedding = embedding.tolist()
-        else:
-            msg.embedding = embedding
+        # Embeddings are stored as float32 arrays; no list roundtrip
+        msg.embedding = np.asarray(embedding, dtype=np.float32)
     return msg
 
 
@@ -50,7 +47,7 @@ def sample_state():
 @pytest.fixture
 def sample_embedding():
     """Create sample embedding vector."""
-    return np.random.rand(384).tolist()
+    return np.random.rand(384).astype(np.float32)
 
 
 @pytest.fixture
@@ -58,7 +55,7 @@ def messages_with_embeddings(sample_messages, sample_embedding):
     """Create messages with embeddings."""
     msgs = sample_messages.copy()
     for msg in msgs:
-        msg.embedding = np.random.rand(384).tolist()
+        msg.embedding = np.random.rand(384).astype(np.float32)
     return msgs
 
 
@@ -57,6 +57,11 @@ class TestTransformationPipeline:
         assert pipeline.trace[1]["transformer"] == "TestTransformer"
         assert "messages_removed" in pipeline.trace[1]
 
+    def test_trace_empty_without_debug(self, sample_context, sample_state):
+        pipeline = TransformationPipeline([TestTransformer()])
+        pipeline.apply(sample_context, sample_state)
+        assert pipeline.trace == []
+
     def test_add_transformer(self, sample_context, sample_state):
         pipeline = TransformationPipeline([])
         assert len(pipeline.transformers) == 0
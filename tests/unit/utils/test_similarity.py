@@ -3,7 +3,12 @@
 import numpy as np
 import pytest
 
-from textile.utils.similarity import cosine_similarity
+from textile.utils.similarity import (
+    cosine_similarity,
+    cosine_similarity_matrix,
+    cosine_similarity_normalized,
+    normalize,
+)
 
 
 class TestCosineSimilarity:
@@ -95,6 +100,12 @@ class TestCosineSimilarity:
         result = cosine_similarity(a, b)
         assert 0.0 <= result <= 1.0
 
+    def test_large_norm_product_does_not_overflow(self):
+        # ||a||² · ||b||² = 1e40 exceeds float32 range
+        a = np.array([1e10, 0.0], dtype=np.float32)
+        b = np.array([1e10, 1e9], dtype=np.float32)
+        assert cosine_similarity(a, b) == pytest.approx(1e10 / np.hypot(1e10, 1e9), rel=1e-6)
+
     @pytest.mark.parametrize("dim", [2, 10, 100, 1536])
     def test_various_dimensions(self, dim):
         a = np.random.rand(dim).astype(np.float32)
@@ -102,3 +113,78 @@ class TestCosineSimilarity:
         result = cosine_similarity(a, b)
         assert 0.0 <= result <= 1.0
         assert isinstance(result, float)
+
+
+class TestCosineSimilarityNormalized:
+    """Test dot-product similarity for unit vectors."""
+
+    @pytest.mark.parametrize("dim", [2, 384, 1536])
+    def test_matches_cosine_similarity(self, dim):
+        a = np.random.rand(dim).astype(np.float32)
+        b = np.random.rand(dim).astype(np.float32)
+        a_unit = a / np.linalg.norm(a)
+        b_unit = b / np.linalg.norm(b)
+        assert cosine_similarity_normalized(a_unit, b_unit) == pytest.approx(
+            cosine_similarity(a, b), abs=1e-6
+        )
+
+    @pytest.mark.parametrize(
+        "a,b,expected",
+        [
+            ([1.0, 0.0], [-1.0, 0.0], 0.0),
+            ([1.0, 0.0], [1.0, 0.0], 1.0),
+            ([0.0, 0.0], [1.0, 0.0], 0.0),
+        ],
+    )
+    def test_clamped_to_zero_one(self, a, b, expected):
+        assert cosine_similarity_normalized(a, b) == expected
+
+    def test_misaligned_shapes_raise_error(self):
+        with pytest.raises(ValueError):
+            cosine_similarity_normalized(np.ones(3), np.ones(4))
+
+
+class TestCosineSimilarityMatrix:
+    """Test pairwise similarity between row sets."""
+
+    def test_matches_pairwise_cosine_similarity(self):
+        rng = np.random.default_rng(0)
+        a = rng.standard_normal((5, 16)).astype(np.float32)
+        b = rng.standard_normal((3, 16)).astype(np.float32)
+        result = cosine_similarity_matrix(a, b)
+        assert result.shape == (5, 3) and result.dtype == np.float32
+        expected = [[cosine_similarity(x, y) for y in b] for x in a]
+        np.testing.assert_allclose(result, expected, atol=1e-6)
+
+    def test_zero_rows_score_zero(self):
+        a = np.array([[0.0, 0.0], [1.0, 0.0]], dtype=np.float32)
+        result = cosine_similarity_matrix(a, a)
+        np.testing.assert_array_equal(result, [[0.0, 0.0], [0.0, 1.0]])
+
+    @pytest.mark.parametrize(
+        "a_shape,b_shape,match",
+        [((3,), (2, 3), "must be 2D"), ((2, 3), (2, 4), "must match")],
+    )
+    def test_invalid_shapes_raise_error(self, a_shape, b_shape, match):
+        with pytest.raises(ValueError, match=match):
+            cosine_similarity_matrix(np.ones(a_shape), np.ones(b_shape))
+
+
+class TestNormalize:
+    """Test L2 normalization helper."""
+
+    def test_returns_unit_float32_copy(self):
+        vector = np.array([3.0, 4.0])
+        unit = normalize(vector)
+        assert unit.dtype == np.float32
+        np.testing.assert_allclose(unit, [0.6, 0.8])
+        assert vector[0] == 3.0
+
+    def test_zero_vector_unchanged(self):
+        np.testing.assert_array_equal(normalize([0.0, 0.0]), [0.0, 0.0])
+
+    def test_dot_of_normalized_matches_cosine(self):
+        a, b = np.random.rand(64), np.random.rand(64)
+        assert cosine_similarity_normalized(normalize(a), normalize(b)) == pytest.approx(
+            cosine_similarity(a, b), abs=1e-6
+        )
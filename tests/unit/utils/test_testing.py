@@ -0,0 +1,97 @@
+"""Tests for transformer testing utilities."""
+
+import pytest
+
+from textile.transformers.base import ContextTransformer
+from textile.utils.testing import (
+    DEFAULT_MAX_TOKENS,
+    TransformerTestCase,
+    assert_message_preserved,
+    assert_system_messages_preserved,
+    create_context,
+    create_turn_state,
+)
+
+MESSAGES = [
+    {"role": "system", "content": "Be helpful", "turn_index": 0},
+    {"role": "user", "content": "Old question", "turn_index": 1},
+    {"role": "user", "content": "New question", "turn_index": 9},
+]
+
+
+class DropOldUserMessages(ContextTransformer):
+    """Remove user messages older than max_age turns; skip single-message contexts."""
+
+    def __init__(self, max_age: int = 5):
+        self.max_age = max_age
+
+    def transform(self, context, state):
+        context.messages = [
+            m
+            for m in context.messages
+            if m.role != "user" or state.turn_index - m.turn_index <= self.max_age
+        ]
+        return context, state
+
+    def should_apply(self, context, state):
+        return len(context.messages) > 1
+
+
+class TestBuilders:
+    def test_create_context_defaults_max_tokens(self):
+        context = create_context(MESSAGES)
+        assert context.max_tokens == DEFAULT_MAX_TOKENS
+        assert [m.turn_index for m in context.messages] == [0, 1, 9]
+
+    def test_create_context_explicit_max_tokens(self):
+        assert create_context(MESSAGES, max_tokens=100).max_tokens == 100
+
+    def test_create_turn_state(self):
+        state = create_turn_state(turn_index=5, metadata={"test": True}, user_message="Hi")
+        assert (state.turn_index, state.metadata, state.tools) == (5, {"test": True}, [])
+        assert state.user_message == "Hi"
+
+
+class TestAssertions:
+    def test_message_preserved_by_role_and_content(self):
+        context = create_context(MESSAGES)
+        assert_message_preserved(context, role="user", content="New")
+
+    def test_message_preserved_by_id(self):
+        context = create_context(MESSAGES)
+        assert_message_preserved(context, message_id=context.messages[1].id)
+
+    def test_missing_message_raises(self):
+        with pytest.raises(AssertionError, match="role=system, content=question"):
+            assert_message_preserved(create_context(MESSAGES), role="system", content="question")
+
+    def test_system_messages_preserved(self):
+        assert_system_messages_preserved(create_context(MESSAGES))
+        with pytest.raises(AssertionError, match="No system messages"):
+            assert_system_messages_preserved(create_context(MESSAGES[1:]))
+
+
+class TestAssertAppliedAndApply(TransformerTestCase):
+    def test_returns_transformed_context_and_state(self):
+        context, state = self.assert_applied_and_apply(
+            DropOldUserMessages(), MESSAGES, current_turn=10, expected_removed=1
+        )
+        assert [m.content for m in context.messages] == ["Be helpful", "New question"]
+        assert state.turn_index == 10
+
+    def test_should_apply_false_raises(self):
+        with pytest.raises(
+            AssertionError, match=r"DropOldUserMessages.should_apply\(\) returned False"
+        ):
+            self.assert_applied_and_apply(DropOldUserMessages(), MESSAGES[:1])
+
+    def test_expected_removed_mismatch_raises(self):
+        with pytest.raises(AssertionError, match="Expected 2 messages removed, got 1"):
+            self.assert_applied_and_apply(
+                DropOldUserMessages(), MESSAGES, current_turn=10, expected_removed=2
+            )
+
+    def test_matches_apply_transformer(self):
+        applied, _ = self.assert_applied_and_apply(DropOldUserMessages(), MESSAGES, current_turn=10)
+        plain, _ = self.apply_transformer(DropOldUserMessages(), MESSAGES, current_turn=10)
+        assert [m.content for m in applied.messages] == [m.content for m in plain.messages]
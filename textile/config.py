@@ -1,8 +1,15 @@
 """Configuration management for Textile."""
 
+from typing import TYPE_CHECKING
+
+import litellm
+
 from textile.embeddings.base import EmbeddingModel
 from textile.transformers.base import ContextTransformer
 
+if TYPE_CHECKING:
+    from textile.lite.semantic_cache import SemanticCache
+
 
 class TextileConfig:
     """Global configuration for embedding model and transformers.
@@ -16,6 +23,9 @@ class TextileConfig:
         """Initialize empty configuration."""
         self._embedding_model: EmbeddingModel | None = None
         self._transformers: list[ContextTransformer] = []
+        self._cache: litellm.Cache | None = None
+        self._previous_litellm_cache: litellm.Cache | None = None
+        self._semantic_cache: SemanticCache | None = None
 
     @property
     def embedding_model(self) -> EmbeddingModel | None:
@@ -37,6 +47,36 @@ class TextileConfig:
         """Set transformation pipeline."""
         self._transformers = value
 
+    @property
+    def cache(self) -> litellm.Cache | None:
+        """LiteLLM response cache used by completion() and embedding()."""
+        return self._cache
+
+    @cache.setter
+    def cache(self, value: litellm.Cache | None) -> None:
+        """Set response cache, installed as the process-wide litellm.cache.
+
+        Whatever litellm.cache held before Textile installed one is restored
+        when this is set back to None, so other LiteLLM users in the process
+        get their own cache back.
+        """
+        if self._cache is None:
+            self._previous_litellm_cache = litellm.cache
+        self._cache = value
+        litellm.cache = value if value is not None else self._previous_litellm_cache
+        if value is None:
+            self._previous_litellm_cache = None
+
+    @property
+    def semantic_cache(self) -> "SemanticCache | None":
+        """Similarity-matched response cache for non-streaming completions."""
+        return self._semantic_cache
+
+    @semantic_cache.setter
+    def semantic_cache(self, value: "SemanticCache | None") -> None:
+        """Set semantic cache (None disables)."""
+        self._semantic_cache = value
+
 
 _config = TextileConfig()
 
@@ -49,6 +89,8 @@ def get_config() -> TextileConfig:
 def configure(
     embedding_model: EmbeddingModel | None = None,
     transformers: list[ContextTransformer] | None = None,
+    cache: litellm.Cache | None = None,
+    semantic_cache: "SemanticCache | None" = None,
 ) -> None:
     """Configure Textile globally.
 
@@ -60,6 +102,15 @@ def configure(
         embedding_model: Embedding model for semantic transformers.
         transformers: Pipeline applied to all completions.
             Per-call transformers override (replace, not extend).
+        cache: LiteLLM cache (e.g. litellm.Cache(type="disk")). Repeated calls
+            with the same model, transformed messages and tools are served
+            without a provider round-trip. Bypass per call with
+            cache={"no-cache": True}. Installed as litellm.cache, which is
+            process-wide; set get_config().cache = None to restore the
+            previous litellm.cache.
+        semantic_cache: textile.lite.semantic_cache.SemanticCache. Non-streaming
+            completions whose final message is close enough to a cached one
+            (with identical earlier messages) reuse the cached response.
 
     Example:
         >>> import textile
@@ -77,3 +128,9 @@ def configure(
 
     if transformers is not None:
         config.transformers = transformers
+
+    if cache is not None:
+        config.cache = cache
+
+    if semantic_cache is not None:
+        config.semantic_cache = semantic_cache
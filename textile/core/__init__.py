@@ -2,7 +2,12 @@
 
 from textile.core.context_window import ContextWindow
 from textile.core.message import Message
-from textile.core.metadata import DataclassMetadata, MessageMetadata, TransformerMetadata
+from textile.core.metadata import (
+    DataclassMetadata,
+    EmbeddingVector,
+    MessageMetadata,
+    TransformerMetadata,
+)
 from textile.core.response_handler import StreamingResponseHandler
 from textile.core.response_pattern import OnPattern
 from textile.core.turn_state import TurnState
@@ -10,6 +15,7 @@ from textile.core.turn_state import TurnState
 __all__ = [
     "ContextWindow",
     "DataclassMetadata",
+    "EmbeddingVector",
     "Message",
     "MessageMetadata",
     "OnPattern",
@@ -1,10 +1,26 @@
 """Mutable message container with token budget."""
 
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from typing import Any
 
 from textile.core.message import Message
 
+# Bound on first use: importing textile.lite at module load would be circular
+# (textile.lite imports this module), but re-running the import statement on
+# every total_tokens() call is wasted work.
+_count_tokens: Callable[..., int] | None = None
+
+
+def _get_count_tokens() -> Callable[..., int]:
+    """Return textile.lite.tokens.count_tokens, importing it once."""
+    global _count_tokens
+    if _count_tokens is None:
+        from textile.lite.tokens import count_tokens
+
+        _count_tokens = count_tokens
+    return _count_tokens
+
 
 @dataclass
 class ContextWindow:
@@ -17,10 +33,15 @@ class ContextWindow:
     - Transform on render (simple pass-through)
 
     Transformers mutate messages directly via context.messages.
+
+    ID lookups go through a lazily validated id -> position index, so direct
+    mutation of context.messages never yields a wrong result; a stale entry
+    just triggers a rebuild on the next lookup.
     """
 
     messages: list[Message]
     max_tokens: int
+    _id_index: dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def add_message(self, message: Message, position: int | None = None) -> None:
         """Add message at position."""
@@ -30,17 +51,37 @@ class ContextWindow:
             self.messages.insert(position, message)
 
     def remove_message(self, message_id: str) -> bool:
-        """Remove message by ID."""
-        original_length = len(self.messages)
-        self.messages = [msg for msg in self.messages if msg.id != message_id]
-        return len(self.messages) < original_length
+        """Remove every message with this ID."""
+        kept = [msg for msg in self.messages if msg.id != message_id]
+        if len(kept) == len(self.messages):
+            return False
+        self.messages = kept
+        self._rebuild_index()
+        return True
 
     def get_message_by_id(self, message_id: str) -> Message | None:
         """Get message by ID."""
-        for msg in self.messages:
-            if msg.id == message_id:
-                return msg
-        return None
+        if (position := self._position_of(message_id)) is None:
+            return None
+        return self.messages[position]
+
+    def _position_of(self, message_id: str) -> int | None:
+        """Look up a message position, rebuilding the index if it is stale."""
+        messages = self.messages
+        position = self._id_index.get(message_id)
+        if position is not None and position < len(messages):
+            if messages[position].id == message_id:
+                return position
+
+        return self._rebuild_index().get(message_id)
+
+    def _rebuild_index(self) -> dict[str, int]:
+        """Rebuild the id -> position index (first occurrence wins)."""
+        index: dict[str, int] = {}
+        for i, msg in enumerate(self.messages):
+            index.setdefault(msg.id, i)
+        self._id_index = index
+        return index
 
     def get_messages_by_role(self, role: str) -> list[Message]:
         """Get messages by role."""
@@ -54,12 +95,9 @@ class ContextWindow:
         self, model: str = "gpt-3.5-turbo", custom_tokenizer: Any | None = None
     ) -> int:
         """Count tokens using model-specific tokenizer."""
-        from textile.lite.tokens import count_tokens
-
-        message_dicts = [msg.to_dict() for msg in self.messages]
-        return count_tokens(
+        return _get_count_tokens()(
             model=model,
-            messages=message_dicts,
+            messages=self.render(),
             custom_tokenizer=custom_tokenizer,
         )
 
@@ -1,10 +1,15 @@
 """Message for LLM APIs with transformer support."""
 
-import uuid
+import os
 from dataclasses import dataclass, field
 from typing import Any
 
-from textile.core.metadata import MessageMetadata
+import numpy as np
+import numpy.typing as npt
+
+from textile.core.metadata import EmbeddingVector, MessageMetadata
+
+_VALID_ROLES = frozenset({"system", "user", "assistant", "tool"})
 
 
 @dataclass
@@ -29,7 +34,10 @@ class Message:
     metadata: MessageMetadata = field(default_factory=MessageMetadata)
     tool_calls: list[dict] | None = None
     tool_call_id: str | None = None
-    id: str = field(default_factory=lambda: f"msg_{uuid.uuid4().hex[:8]}")
+    # 64 random bits: ids from other processes, workers or restored messages
+    # will not collide, unlike a per-process counter; os.urandom skips
+    # building a UUID object
+    id: str = field(default_factory=lambda: f"msg_{os.urandom(8).hex()}")
 
     @property
     def turn_index(self) -> int:
@@ -42,15 +50,20 @@ class Message:
         self.metadata.turn_index = value
 
     @property
-    def embedding(self) -> list[float] | None:
+    def embedding(self) -> EmbeddingVector | None:
         """Get embedding from metadata."""
         return self.metadata.embedding
 
     @embedding.setter
-    def embedding(self, value: list[float] | None) -> None:
+    def embedding(self, value: EmbeddingVector | None) -> None:
         """Set embedding in metadata."""
         self.metadata.embedding = value
 
+    @property
+    def unit_embedding(self) -> npt.NDArray[np.float32] | None:
+        """Get cached L2-normalized embedding from metadata."""
+        return self.metadata.unit_embedding
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to LLM API format (OpenAI/LiteLLM)."""
         result = {"role": self.role, "content": self.content}
@@ -72,6 +85,5 @@ class Message:
 
     def __post_init__(self) -> None:
         """Validate role."""
-        valid_roles = {"system", "user", "assistant", "tool"}
-        if self.role not in valid_roles:
-            raise ValueError(f"Invalid role '{self.role}'. Must be one of {valid_roles}")
+        if self.role not in _VALID_ROLES:
+            raise ValueError(f"Invalid role '{self.role}'. Must be one of {sorted(_VALID_ROLES)}")
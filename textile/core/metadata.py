@@ -1,10 +1,17 @@
 """Message metadata with global properties and typed namespaces."""
 
-from dataclasses import asdict, dataclass
+import math
+from dataclasses import dataclass, fields
 from typing import Any, Protocol, TypeVar
 
+import numpy as np
+import numpy.typing as npt
+
 T = TypeVar("T", bound="TransformerMetadata")
 
+# Embeddings may be stored as plain lists or as numpy arrays (no conversion)
+EmbeddingVector = list[float] | npt.NDArray[np.float32]
+
 
 class TransformerMetadata(Protocol):
     """Protocol for transformer-specific metadata."""
@@ -32,8 +39,12 @@ class DataclassMetadata:
         pass
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dict."""
-        return asdict(self)
+        """Convert to a shallow dict of fields.
+
+        Field values are not copied. Subclasses with nested dataclass fields
+        that must serialize recursively should override this.
+        """
+        return {f.name: getattr(self, f.name) for f in fields(self)}
 
     @classmethod
     def from_dict(cls: type[T], data: dict[str, Any]) -> T:
@@ -41,12 +52,20 @@ class DataclassMetadata:
         return cls(**data)
 
 
+# Global properties stored in dedicated slots rather than the raw dict
+_TYPED_SLOTS = {"prominence": "_prominence", "turn_index": "_turn_index", "embedding": "_embedding"}
+
+
 class MessageMetadata:
     """Two-tier metadata: global properties and typed namespaces.
 
     Global properties: prominence, turn_index, embedding
     Namespaces: transformer-specific typed metadata in isolated namespaces
 
+    Global properties live in typed slots (types are enforced on write, so
+    reads are plain attribute loads); other raw keys set via _set_raw() go
+    to a small per-instance dict.
+
     Example:
         >>> metadata = MessageMetadata()
         >>> metadata.prominence = 0.85
@@ -55,44 +74,71 @@ class MessageMetadata:
         >>> decay = metadata.get_namespace("semantic_decay", SemanticDecayMetadata)
     """
 
+    __slots__ = ("_prominence", "_turn_index", "_embedding", "_extra", "_namespaces", "_unit_cache")
+
     def __init__(self) -> None:
-        """Initialize metadata with empty properties and namespaces."""
-        self._global: dict[str, Any] = {}
+        """Initialize metadata with default properties and no namespaces."""
+        self._prominence: float = 1.0
+        self._turn_index: int = 0
+        self._embedding: EmbeddingVector | None = None
+        self._extra: dict[str, Any] = {}
         self._namespaces: dict[str, dict[str, Any]] = {}
+        self._unit_cache: tuple[Any, npt.NDArray[np.float32]] | None = None
 
     @property
     def prominence(self) -> float:
         """Relevance score (0.0-1.0)."""
-        return float(self._global.get("prominence", 1.0))
+        return self._prominence
 
     @prominence.setter
     def prominence(self, value: float) -> None:
         """Set relevance score, clamped to [0.0, 1.0]."""
         if value < 0.0:
             raise ValueError(f"prominence must be >= 0.0, got {value}")
-        self._global["prominence"] = min(value, 1.0)
+        self._prominence = min(float(value), 1.0)
 
     @property
     def turn_index(self) -> int:
         """Turn when created."""
-        return int(self._global.get("turn_index", 0))
+        return self._turn_index
 
     @turn_index.setter
     def turn_index(self, value: int) -> None:
         """Set turn index."""
         if value < 0:
             raise ValueError(f"turn_index must be >= 0, got {value}")
-        self._global["turn_index"] = value
+        self._turn_index = int(value)
 
     @property
-    def embedding(self) -> list[float] | None:
-        """Semantic vector."""
-        return self._global.get("embedding")
+    def embedding(self) -> EmbeddingVector | None:
+        """Semantic vector, stored as given (list or numpy array)."""
+        return self._embedding
 
     @embedding.setter
-    def embedding(self, value: list[float] | None) -> None:
+    def embedding(self, value: EmbeddingVector | None) -> None:
         """Set semantic vector embedding."""
-        self._global["embedding"] = value
+        self._embedding = value
+        self._unit_cache = None
+
+    @property
+    def unit_embedding(self) -> npt.NDArray[np.float32] | None:
+        """L2-normalized float32 copy of the embedding.
+
+        Computed once per assigned embedding and cached, so similarity against
+        a normalized query reduces to a dot product. Embeddings are treated as
+        immutable: reassign rather than mutate in place. A zero vector is
+        returned unchanged.
+        """
+        if (embedding := self._embedding) is None:
+            return None
+        if self._unit_cache is not None and self._unit_cache[0] is embedding:
+            return self._unit_cache[1]
+        # Normalized inline so textile.core does not import textile.utils
+        unit = np.array(embedding, dtype=np.float32)
+        if (norm := math.sqrt(float(np.dot(unit, unit)))) > 0.0:
+            unit /= norm
+        self._unit_cache = (embedding, unit)
+        return unit
 
     def get_namespace(
         self,
@@ -116,7 +162,12 @@ class MessageMetadata:
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dict."""
         return {
-            "global": self._global.copy(),
+            "global": {
+                "prominence": self._prominence,
+                "turn_index": self._turn_index,
+                "embedding": self._embedding,
+                **self._extra,
+            },
             "namespaces": {k: v.copy() for k, v in self._namespaces.items()},
         }
 
@@ -124,18 +175,34 @@ class MessageMetadata:
     def from_dict(cls, data: dict[str, Any]) -> "MessageMetadata":
         """Deserialize from dict."""
         metadata = cls()
-        metadata._global = data.get("global", {}).copy()
+        for key, value in data.get("global", {}).items():
+            metadata._set_raw(key, value)
         metadata._namespaces = {k: v.copy() for k, v in data.get("namespaces", {}).items()}
         return metadata
 
     def _get_raw(self, key: str) -> Any:
         """Get raw global value (backward compatibility)."""
-        return self._global.get(key)
+        if (slot := _TYPED_SLOTS.get(key)) is not None:
+            return getattr(self, slot)
+        return self._extra.get(key)
 
     def _set_raw(self, key: str, value: Any) -> None:
-        """Set raw global value (backward compatibility)."""
-        self._global[key] = value
+        """Set raw global value (backward compatibility).
+
+        Global properties are type-coerced but not range-checked.
+        """
+        if key == "prominence":
+            self._prominence = float(value)
+        elif key == "turn_index":
+            self._turn_index = int(value)
+        elif key == "embedding":
+            self._embedding = value
+        else:
+            self._extra[key] = value
 
     def _contains(self, key: str) -> bool:
-        """Check if key exists in global (backward compatibility)."""
-        return key in self._global
+        """Check if key exists in global (backward compatibility).
+
+        Global properties always have a value, so they are always present.
+        """
+        return key in _TYPED_SLOTS or key in self._extra
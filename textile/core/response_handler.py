@@ -2,6 +2,9 @@
 
 import logging
 import re
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import cast
 
 from textile.core.response_pattern import OnPattern
 
@@ -23,6 +26,12 @@ class StreamingResponseHandler:
         """Initialize response handler."""
         self.patterns = patterns
         self.max_buffer_size = max_buffer_size
+        # OnPattern compiles in __post_init__; resolve the compiled regex and its
+        # source length once rather than re-checking them on every chunk
+        self._compiled: tuple[tuple[OnPattern, re.Pattern], ...] = tuple(
+            (p, p.pattern) for p in patterns if isinstance(p.pattern, re.Pattern)
+        )
+        self._pattern_lens = [len(regex.pattern) for _, regex in self._compiled]
         self.buffer = ""
         self.buffer_threshold = self._calculate_buffer_threshold()
         self.stats = {
@@ -33,15 +42,10 @@ class StreamingResponseHandler:
 
     def _calculate_buffer_threshold(self) -> int:
         """Calculate buffer retention size from pattern lengths."""
-        if not self.patterns:
+        if not self._compiled:
             return MIN_BUFFER_SIZE
 
-        max_pattern_len = MIN_BUFFER_SIZE
-        for pattern in self.patterns:
-            assert isinstance(pattern.pattern, re.Pattern)
-            pattern_str = pattern.pattern.pattern
-            max_pattern_len = max(max_pattern_len, len(pattern_str))
-
+        max_pattern_len = max(MIN_BUFFER_SIZE, *self._pattern_lens)
         return min(max_pattern_len + DEFAULT_SAFETY_MARGIN, self.max_buffer_size // 2)
 
     def transform_chunk(self, chunk: str) -> str:
@@ -50,6 +54,11 @@ class StreamingResponseHandler:
             return ""
 
         self.stats["chunks_processed"] += 1
+
+        # Nothing can match, so there is no reason to hold text back
+        if not self._compiled and not self.buffer:
+            return chunk
+
         self.buffer += chunk
         safe_boundary = self._find_safe_boundary()
 
@@ -79,75 +88,148 @@ class StreamingResponseHandler:
             logger.warning(f"Buffer exceeded max size ({self.max_buffer_size}), forcing flush")
             return max(0, safe_boundary)
 
-        for pattern in self.patterns:
-            assert isinstance(pattern.pattern, re.Pattern)
-            for match in pattern.pattern.finditer(self.buffer):
+        for pattern, regex in self._compiled:
+            if (literal := pattern._literal) is not None:
+                safe_boundary = self._adjust_for_literal(safe_boundary, literal)
+                continue
+
+            # Every match starts with the pattern's literal prefix, so when the
+            # prefix is absent from the scanned range nothing can match there
+            prefix = pattern._prefix
+            if prefix and prefix not in self.buffer:
+                continue
+
+            # Scan the whole buffer: a regex match can be longer than
+            # buffer_threshold, so one straddling the boundary may start anywhere
+            for match in regex.finditer(self.buffer):
                 if match.start() < safe_boundary < match.end():
                     safe_boundary = match.start()
 
-            safe_boundary = self._adjust_for_partial_pattern(safe_boundary, pattern.pattern)
+            safe_boundary = self._adjust_for_partial_pattern(safe_boundary, regex, prefix)
 
         return max(0, safe_boundary)
 
-    def _adjust_for_partial_pattern(self, boundary: int, pattern: re.Pattern) -> int:
-        """Adjust boundary to avoid splitting starting pattern."""
+    def _adjust_for_partial_pattern(
+        self, boundary: int, pattern: re.Pattern, prefix: str = ""
+    ) -> int:
+        """Adjust boundary to avoid splitting starting pattern.
+
+        With a literal prefix, only offsets where str.find locates the prefix
+        are tried with the regex.
+        """
         if boundary <= 0 or boundary >= len(self.buffer):
             return boundary
 
         search_start = max(0, boundary - self.buffer_threshold)
-        search_region = self.buffer[search_start : boundary + self.buffer_threshold]
+        search_end = min(len(self.buffer), boundary + self.buffer_threshold)
+
+        # Match in place with pos/endpos instead of slicing a fresh suffix per offset.
+        # Only starts before the boundary can straddle it.
+        start = search_start
+        while start < boundary:
+            if prefix:
+                start = self.buffer.find(prefix, start, search_end)
+                if start == -1 or start >= boundary:
+                    break
+            if match := pattern.match(self.buffer, start, search_end):
+                if boundary < match.end():
+                    return start
+            start += 1
 
-        for i in range(len(search_region)):
-            if match := pattern.match(search_region[i:]):
-                match_start_in_buffer = search_start + i
-                match_end_in_buffer = search_start + i + match.end()
-
-                if match_start_in_buffer < boundary < match_end_in_buffer:
-                    return match_start_in_buffer
+        return boundary
 
+    def _adjust_for_literal(self, boundary: int, literal: str) -> int:
+        """Move boundary before any occurrence of literal that straddles it."""
+        span = len(literal)
+        while boundary > 0:
+            start = self.buffer.find(literal, max(0, boundary - span + 1), boundary + span - 1)
+            if start == -1 or start >= boundary:
+                break
+            boundary = start
         return boundary
 
     def _apply_patterns(self, text: str) -> str:
         """Apply pattern handlers sequentially."""
-        if not self.patterns:
+        if not self._compiled:
             return text
 
         result = text
 
-        for pattern_handler in self.patterns:
+        for pattern_handler, regex in self._compiled:
             try:
                 result = self._apply_single_pattern(result, pattern_handler)
             except Exception as e:
-                assert isinstance(pattern_handler.pattern, re.Pattern)
-                logger.error(
-                    f"Error applying pattern {pattern_handler.pattern.pattern}: {e}", exc_info=True
-                )
+                logger.error(f"Error applying pattern {regex.pattern}: {e}", exc_info=True)
                 self.stats["errors"] += 1
 
         return result
 
     def _apply_single_pattern(self, text: str, handler: OnPattern) -> str:
         """Apply single OnPattern handler."""
+        literal = handler._literal
+        if literal is not None and isinstance(handler.replacement, str):
+            count = text.count(literal)
+            if handler.max_replacements >= 0:
+                count = min(count, handler.max_replacements)
+            self.stats["patterns_applied"] += count
+            return text.replace(literal, handler.replacement, count) if count else text
+
+        # Cheap substring test before running the regex over text that cannot match
+        if handler._prefix and handler._prefix not in text:
+            return text
+
+        regex = cast(re.Pattern[str], handler.pattern)
+        if isinstance(handler.replacement, str):
+            # Fixed replacement: let subn run entirely in C, with backslashes
+            # escaped so the text is not read as a group reference template.
+            # subn treats count=0 as unlimited, so handle max_replacements=0 here.
+            if handler.max_replacements == 0:
+                return text
+            result, count = regex.subn(
+                handler.replacement.replace("\\", "\\\\"),
+                text,
+                count=max(handler.max_replacements, 0),
+            )
+            self.stats["patterns_applied"] += count
+            return result
+
         replacements_made = 0
 
-        def replace_func(match: re.Match) -> str:
+        def replace_func(match: re.Match[str]) -> str:
             nonlocal replacements_made
 
             if handler.max_replacements >= 0 and replacements_made >= handler.max_replacements:
-                return str(match.group(0))
+                return match.group(0)
 
             try:
                 replacement = handler.get_replacement(match)
                 replacements_made += 1
                 self.stats["patterns_applied"] += 1
-                return str(replacement)
+                return replacement
             except Exception as e:
                 logger.error(f"Error in replacement function: {e}", exc_info=True)
                 self.stats["errors"] += 1
-                return str(match.group(0))
+                return match.group(0)
 
-        assert isinstance(handler.pattern, re.Pattern)
-        return str(handler.pattern.sub(replace_func, text))
+        return regex.sub(replace_func, text)
+
+    def transform_text(self, text: str) -> str:
+        """Transform a complete, non-streamed text in one pass.
+
+        Applies the patterns to the whole text at once; with no chunk
+        boundaries to protect, buffering and boundary scanning are skipped.
+        """
+        if not text:
+            return ""
+
+        self.stats["chunks_processed"] += 1
+
+        try:
+            return self._apply_patterns(text)
+        except Exception as e:
+            logger.error(f"Error transforming text: {e}", exc_info=True)
+            self.stats["errors"] += 1
+            return text
 
     def flush(self) -> str:
         """Flush remaining buffer at stream end."""
@@ -165,6 +247,11 @@ class StreamingResponseHandler:
             self.buffer = ""
             return result
 
-    def get_stats(self) -> dict:
-        """Get processing statistics."""
-        return self.stats.copy()
+    def get_stats(self, snapshot: bool = True) -> Mapping[str, int]:
+        """Get processing statistics.
+
+        With snapshot=False, returns a read-only live view instead of a copy.
+        """
+        if snapshot:
+            return self.stats.copy()
+        return MappingProxyType(self.stats)
@@ -1,13 +1,58 @@
 """Declarative pattern matching for response transformations."""
 
+import functools
 import inspect
 import logging
 import re
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+_REGEX_SPECIAL = frozenset(".^$*+?{}[]()|\\")
+_OPTIONAL_QUANTIFIERS = frozenset("*?{")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_literal(text: str, flags: int) -> re.Pattern:
+    """Compile a literal string pattern, memoized across OnPattern instances."""
+    return re.compile(re.escape(text), flags)
+
+
+@functools.lru_cache(maxsize=256)
+def _literal_prefix(pattern: re.Pattern) -> str:
+    """Return literal text every match of pattern must start with.
+
+    Conservative: returns "" for case-insensitive or verbose patterns and for
+    any alternation, and stops at the first construct it does not understand.
+    """
+    source = pattern.pattern
+    if not isinstance(source, str) or "|" in source:
+        return ""
+    if pattern.flags & (re.IGNORECASE | re.VERBOSE):
+        return ""
+
+    prefix: list[str] = []
+    i = 0
+    while i < len(source):
+        char = source[i]
+        if char == "\\":
+            # Escaped punctuation is literal; letters and digits are classes or references
+            if i + 1 >= len(source) or source[i + 1].isalnum():
+                break
+            char = source[i + 1]
+            i += 2
+        elif char in _REGEX_SPECIAL:
+            break
+        else:
+            i += 1
+        prefix.append(char)
+
+    # A quantifier allowing zero repetitions makes the last collected char optional
+    if i < len(source) and source[i] in _OPTIONAL_QUANTIFIERS and prefix:
+        prefix.pop()
+    return "".join(prefix)
+
 
 @dataclass
 class OnPattern:
@@ -25,12 +70,18 @@ class OnPattern:
     replacement: str | Callable[[re.Match], str] | Callable[[], str]
     ignore_case: bool = False
     max_replacements: int = -1
+    _literal: str | None = field(default=None, init=False, repr=False, compare=False)
+    _arity: int | None = field(default=None, init=False, repr=False, compare=False)
+    _prefix: str = field(default="", init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate and compile pattern."""
         if isinstance(self.pattern, str):
+            # Case-sensitive, non-empty string patterns can skip the regex engine
+            if self.pattern and not self.ignore_case:
+                self._literal = self.pattern
             flags = re.IGNORECASE if self.ignore_case else 0
-            self.pattern = re.compile(re.escape(self.pattern), flags)
+            self.pattern = _compile_literal(self.pattern, flags)
         elif isinstance(self.pattern, re.Pattern):
             if self.ignore_case and not (self.pattern.flags & re.IGNORECASE):
                 logger.warning("ignore_case=True but pattern already compiled without IGNORECASE")
@@ -38,20 +89,30 @@ class OnPattern:
             raise TypeError(f"pattern must be str or re.Pattern, got {type(self.pattern).__name__}")
 
         assert isinstance(self.pattern, re.Pattern)
+        self._prefix = _literal_prefix(self.pattern)
 
         if not (isinstance(self.replacement, str) or callable(self.replacement)):
             raise TypeError(
                 f"replacement must be str or Callable, got {type(self.replacement).__name__}"
             )
 
+        # Resolve the callable's arity once instead of on every match
+        if callable(self.replacement):
+            try:
+                self._arity = len(inspect.signature(self.replacement).parameters)
+            except (TypeError, ValueError):
+                self._arity = None
+
     def get_replacement(self, match: re.Match) -> str:
         """Get replacement string for match."""
         if isinstance(self.replacement, str):
             return self.replacement
 
         if callable(self.replacement):
-            sig = inspect.signature(self.replacement)
-            if len(sig.parameters) == 0:
+            arity = self._arity
+            if arity is None:
+                arity = len(inspect.signature(self.replacement).parameters)
+            if arity == 0:
                 return str(self.replacement())  # type: ignore[call-arg]
             return str(self.replacement(match))  # type: ignore[call-arg]
 
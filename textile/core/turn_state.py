@@ -3,8 +3,10 @@
 from dataclasses import dataclass, field
 from typing import Any
 
+from textile.core.metadata import EmbeddingVector
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class TurnState:
     """Immutable turn state for transformer pipeline.
 
@@ -21,6 +23,6 @@ class TurnState:
 
     user_message: str
     turn_index: int = 0
-    user_embedding: list[float] | None = None
+    user_embedding: EmbeddingVector | None = None
     tools: list[dict] | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
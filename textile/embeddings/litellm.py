@@ -1,5 +1,9 @@
 """LiteLLM embedding model implementation."""
 
+import threading
+from collections import OrderedDict
+from typing import cast
+
 import litellm
 import numpy as np
 import numpy.typing as npt
@@ -11,18 +15,26 @@ class Embedding(EmbeddingModel):
     """LiteLLM embedding model.
 
     Supports OpenAI, Cohere, Voyage AI, and more via LiteLLM.
+    Keeps an LRU cache of the most recent cache_size texts (0 disables it).
     """
 
     def __init__(
         self,
         model: str = "text-embedding-3-small",
         dimensions: int | None = None,
+        cache_size: int = 1024,
         **litellm_kwargs,
     ) -> None:
         """Initialize embedding model."""
+        if cache_size < 0:
+            raise ValueError(f"cache_size must be non-negative, got {cache_size}")
+
         self.model = model
         self._dimensions = dimensions
         self.litellm_kwargs = litellm_kwargs
+        self._cache_size = cache_size
+        self._cache: OrderedDict[str, npt.NDArray[np.float32]] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
         # Auto-detect dimension if not provided
         if self._dimensions is None:
@@ -31,14 +43,62 @@ class Embedding(EmbeddingModel):
 
     def encode(self, text: str) -> npt.NDArray[np.float32]:
         """Encode text to embedding vector."""
+        if (cached := self._cache_get(text)) is not None:
+            return cached.copy()
+
         response = litellm.embedding(model=self.model, input=text, **self.litellm_kwargs)
-        return np.array(response.data[0]["embedding"], dtype=np.float32)
+        vector = np.array(response.data[0]["embedding"], dtype=np.float32)
+        self._cache_put(text, vector)
+        return vector
 
     def encode_batch(self, texts: list[str]) -> npt.NDArray[np.float32]:
         """Encode multiple texts to embedding vectors."""
+        if not texts or not self._cache_size:
+            return self._embed_batch(texts)
+
+        # Request only uncached texts (each once), then stitch rows back in order
+        rows = [self._cache_get(text) for text in texts]
+        missing = list(dict.fromkeys(t for t, row in zip(texts, rows, strict=True) if row is None))
+        if missing:
+            fetched = dict(zip(missing, self._embed_batch(missing), strict=True))
+            for text, vector in fetched.items():
+                self._cache_put(text, vector)
+            rows = [fetched[t] if row is None else row for t, row in zip(texts, rows, strict=True)]
+        return np.stack(cast(list[npt.NDArray[np.float32]], rows))
+
+    def _embed_batch(self, texts: list[str]) -> npt.NDArray[np.float32]:
+        """Call LiteLLM for a batch of texts."""
         response = litellm.embedding(model=self.model, input=texts, **self.litellm_kwargs)
-        embeddings = [data["embedding"] for data in response.data]
-        return np.array(embeddings, dtype=np.float32)
+        if not response.data:
+            return np.empty((0, self._dimensions or 0), dtype=np.float32)
+
+        # Fill a preallocated float32 matrix row by row instead of building a
+        # temporary list of lists for np.array to walk and type-check
+        width = len(response.data[0]["embedding"])
+        embeddings = np.empty((len(response.data), width), dtype=np.float32)
+        for i, data in enumerate(response.data):
+            embeddings[i] = data["embedding"]
+        return embeddings
+
+    def _cache_get(self, text: str) -> npt.NDArray[np.float32] | None:
+        """Return the cached vector for text and mark it recently used."""
+        if not self._cache_size:
+            return None
+        with self._cache_lock:
+            vector = self._cache.get(text)
+            if vector is not None:
+                self._cache.move_to_end(text)
+            return vector
+
+    def _cache_put(self, text: str, vector: npt.NDArray[np.float32]) -> None:
+        """Store a private copy of vector, evicting the least recently used."""
+        if not self._cache_size:
+            return
+        with self._cache_lock:
+            self._cache[text] = vector.copy()
+            self._cache.move_to_end(text)
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
 
     @property
     def dimension(self) -> int:
@@ -1,11 +1,13 @@
 """Metrics and observability hooks for transformers."""
 
 import time
+from collections import deque
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
-from typing import Any, Callable
+from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class TransformerMetrics:
     """Metrics collected for a transformer execution.
 
@@ -51,14 +53,39 @@ class MetricsHook:
         >>> hook.on_transform_end("DecayTransformer", context, state)
         >>> metrics = hook.get_metrics()
         >>> print(f"Avg duration: {hook.avg_duration_ms():.2f}ms")
+
+    By default every entry is kept. Pass ``history`` to keep only the most
+    recent entries in long-running processes; queries and summaries then
+    cover the retained entries.
     """
 
-    def __init__(self) -> None:
-        """Initialize metrics hook."""
-        self._metrics: list[TransformerMetrics] = []
-        self._start_times: dict[str, float] = {}
+    def __init__(self, history: int | None = None) -> None:
+        """Initialize metrics hook.
+
+        Args:
+            history: Maximum number of metrics entries to retain (None keeps all)
+
+        Raises:
+            ValueError: If history is not positive
+        """
+        if history is not None and history <= 0:
+            raise ValueError(f"history must be positive, got {history}")
+
+        self._metrics: deque[TransformerMetrics] = deque(maxlen=history)
+        self._start_times: dict[str, int] = {}
         self._before_counts: dict[str, int] = {}
         self._callbacks: list[Callable[[TransformerMetrics], None]] = []
+        self._reset_aggregates()
+
+    def _reset_aggregates(self) -> None:
+        """Reset the running aggregates kept alongside _metrics."""
+        self._by_name: dict[str, deque[TransformerMetrics]] = {}
+        self._duration_by_name: dict[str, float] = {}
+        self._removed_by_name: dict[str, int] = {}
+        self._executed_count = 0
+        self._executed_duration_ms = 0.0
+        self._skipped_count = 0
+        self._total_removed = 0
 
     def on_transform_start(
         self,
@@ -73,7 +100,7 @@ class MetricsHook:
             messages_count: Number of messages before transformation
             should_apply: Whether should_apply returned True
         """
-        self._start_times[transformer_name] = time.time()
+        self._start_times[transformer_name] = time.perf_counter_ns()
         self._before_counts[transformer_name] = messages_count
 
         # If should_apply is False, record as skipped
@@ -96,8 +123,9 @@ class MetricsHook:
         if transformer_name not in self._start_times:
             return
 
-        start_time = self._start_times.pop(transformer_name)
-        duration_ms = (time.time() - start_time) * 1000
+        # Monotonic clock: wall-clock adjustments cannot yield negative durations
+        start_ns = self._start_times.pop(transformer_name)
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         before = self._before_counts.pop(transformer_name, messages_count)
         removed = before - messages_count
@@ -113,11 +141,7 @@ class MetricsHook:
             metadata=metadata or {},
         )
 
-        self._metrics.append(metrics)
-
-        # Trigger callbacks
-        for callback in self._callbacks:
-            callback(metrics)
+        self._record(metrics)
 
     def _record_skip(self, transformer_name: str, messages_count: int) -> None:
         """Record a skipped transformer.
@@ -136,11 +160,58 @@ class MetricsHook:
             skipped=True,
         )
 
+        self._record(metrics)
+
+    def _record(self, metrics: TransformerMetrics) -> None:
+        """Store metrics, update running aggregates, and trigger callbacks.
+
+        Args:
+            metrics: Metrics for one transformer execution or skip
+        """
+        if len(self._metrics) == self._metrics.maxlen:
+            self._evict(self._metrics[0])
         self._metrics.append(metrics)
 
+        # Maintain aggregates so queries do not rescan the full history
+        name = metrics.transformer_name
+        self._by_name.setdefault(name, deque()).append(metrics)
+        self._duration_by_name[name] = self._duration_by_name.get(name, 0.0) + metrics.duration_ms
+        self._removed_by_name[name] = self._removed_by_name.get(name, 0) + metrics.messages_removed
+        self._total_removed += metrics.messages_removed
+        if metrics.skipped:
+            self._skipped_count += 1
+        else:
+            self._executed_count += 1
+            self._executed_duration_ms += metrics.duration_ms
+
+        # Trigger callbacks
         for callback in self._callbacks:
             callback(metrics)
 
+    def _evict(self, metrics: TransformerMetrics) -> None:
+        """Remove the oldest entry's contribution from the running aggregates.
+
+        Args:
+            metrics: Entry about to be dropped from the history
+        """
+        name = metrics.transformer_name
+        entries = self._by_name[name]
+        entries.popleft()
+        if entries:
+            self._duration_by_name[name] -= metrics.duration_ms
+            self._removed_by_name[name] -= metrics.messages_removed
+        else:
+            del self._by_name[name], self._duration_by_name[name], self._removed_by_name[name]
+
+        self._total_removed -= metrics.messages_removed
+        if metrics.skipped:
+            self._skipped_count -= 1
+        else:
+            self._executed_count -= 1
+            self._executed_duration_ms -= metrics.duration_ms
+            if not self._executed_count:
+                self._executed_duration_ms = 0.0
+
     def register_callback(
         self,
         callback: Callable[[TransformerMetrics], None],
@@ -165,7 +236,27 @@ class MetricsHook:
         Returns:
             List of TransformerMetrics
         """
-        return self._metrics.copy()
+        return list(self._metrics)
+
+    def iter_metrics(self) -> Iterator[TransformerMetrics]:
+        """Iterate over collected metrics without copying them.
+
+        Recording or clearing metrics while iterating is not supported; use
+        get_metrics() for a snapshot that stays valid.
+
+        Yields:
+            TransformerMetrics, oldest first
+
+        Raises:
+            RuntimeError: If metrics are recorded or cleared mid-iteration
+        """
+        try:
+            yield from self._metrics
+        except RuntimeError as e:
+            # deque's own error ("deque mutated during iteration") names no caller
+            raise RuntimeError(
+                "MetricsHook changed during iter_metrics(); use get_metrics() for a snapshot"
+            ) from e
 
     def get_metrics_by_transformer(
         self,
@@ -179,7 +270,7 @@ class MetricsHook:
         Returns:
             List of metrics for that transformer
         """
-        return [m for m in self._metrics if m.transformer_name == transformer_name]
+        return list(self._by_name.get(transformer_name, ()))
 
     def avg_duration_ms(self, transformer_name: str | None = None) -> float:
         """Calculate average execution duration.
@@ -191,14 +282,16 @@ class MetricsHook:
             Average duration in milliseconds
         """
         if transformer_name:
-            metrics = self.get_metrics_by_transformer(transformer_name)
+            count = len(self._by_name.get(transformer_name, ()))
+            total = self._duration_by_name.get(transformer_name, 0.0)
         else:
-            metrics = [m for m in self._metrics if not m.skipped]
+            count = self._executed_count
+            total = self._executed_duration_ms
 
-        if not metrics:
+        if not count:
             return 0.0
 
-        return sum(m.duration_ms for m in metrics) / len(metrics)
+        return total / count
 
     def total_messages_removed(self, transformer_name: str | None = None) -> int:
         """Calculate total messages removed.
@@ -210,33 +303,30 @@ class MetricsHook:
             Total messages removed
         """
         if transformer_name:
-            metrics = self.get_metrics_by_transformer(transformer_name)
-        else:
-            metrics = self._metrics
+            return self._removed_by_name.get(transformer_name, 0)
 
-        return sum(m.messages_removed for m in metrics)
+        return self._total_removed
 
     def clear(self) -> None:
         """Clear all collected metrics."""
         self._metrics.clear()
         self._start_times.clear()
         self._before_counts.clear()
+        self._reset_aggregates()
 
     def summary(self) -> dict[str, Any]:
         """Get summary statistics.
 
+        Reads the running aggregates; no pass over the history is needed.
+
         Returns:
-            Dict with summary stats
+            Dict with summary stats (transformers listed in first-seen order)
         """
-        total_executions = len(self._metrics)
-        skipped = len([m for m in self._metrics if m.skipped])
-        executed = total_executions - skipped
-
         return {
-            "total_executions": total_executions,
-            "executed": executed,
-            "skipped": skipped,
+            "total_executions": len(self._metrics),
+            "executed": self._executed_count,
+            "skipped": self._skipped_count,
             "total_messages_removed": self.total_messages_removed(),
             "avg_duration_ms": self.avg_duration_ms(),
-            "transformers": list(set(m.transformer_name for m in self._metrics)),
+            "transformers": list(self._by_name),
         }
@@ -1,7 +1,9 @@
 """Transparent wrapper around LiteLLM completion with modern Python 3.11+ patterns."""
 
+import asyncio
 import logging
 from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
 from typing import Any
 
 import litellm
@@ -11,46 +13,78 @@ from textile.core.context_window import ContextWindow
 from textile.core.message import Message
 from textile.core.response_handler import StreamingResponseHandler
 from textile.core.turn_state import TurnState
+from textile.lite.semantic_cache import SemanticCache
+from textile.transformers.base import ContextTransformer
 
 logger = logging.getLogger(__name__)
 
 
+def _cached_prompt_tokens(response: Any) -> int | None:
+    """Prompt tokens the provider served from its prefix cache, if reported."""
+    try:
+        cached: int | None = response.usage.prompt_tokens_details.cached_tokens
+    except AttributeError:
+        return None
+    return cached
+
+
 def _build_trace(
     context: ContextWindow,
     state: TurnState,
     transformers: list,
+    response: Any = None,
 ) -> dict[str, Any]:
-    """Build debug trace from transformation."""
+    """Build debug trace from transformation.
+
+    cached_prompt_tokens shows how much of the rendered prefix the provider
+    reused; transformers that rewrite early messages lower it on the next turn.
+    """
     return {
         "context_size": len(context.messages),
         "max_tokens": context.max_tokens,
         "user_message": state.user_message,
         "transformers": [t.__class__.__name__ for t in transformers],
         "metadata": state.metadata,
+        "cached_prompt_tokens": _cached_prompt_tokens(response),
     }
 
 
 def _extract_chunk_content(chunk: Any) -> str | None:
     """Extract content from streaming chunk."""
-    if not hasattr(chunk, "choices") or not chunk.choices:
-        return None
-    if not hasattr(chunk.choices[0], "delta"):
-        return None
-    if not (delta := chunk.choices[0].delta):
+    # Well-formed chunks take the fast path; anything else yields None
+    try:
+        content: str | None = chunk.choices[0].delta.content
+    except (AttributeError, IndexError, TypeError):
         return None
-    return getattr(delta, "content", None)
+    return content
 
 
-def _create_flush_chunk(content: str) -> Any:
-    """Create final chunk for flushed content."""
-    from types import SimpleNamespace
+@dataclass(slots=True)
+class _FlushDelta:
+    """Delta of the synthetic final chunk."""
 
-    try:
-        delta = SimpleNamespace(content=content)
-        choice = SimpleNamespace(delta=delta, index=0, finish_reason=None)
-        return SimpleNamespace(choices=[choice])
-    except Exception:
-        return None
+    content: str
+
+
+@dataclass(slots=True)
+class _FlushChoice:
+    """Choice of the synthetic final chunk."""
+
+    delta: _FlushDelta
+    index: int = 0
+    finish_reason: str | None = None
+
+
+@dataclass(slots=True)
+class _FlushChunk:
+    """Chunk-shaped carrier for text released by the handler at stream end."""
+
+    choices: list[_FlushChoice]
+
+
+def _create_flush_chunk(content: str) -> _FlushChunk:
+    """Create final chunk for flushed content."""
+    return _FlushChunk(choices=[_FlushChoice(delta=_FlushDelta(content=content))])
 
 
 def _process_stream_chunk(
@@ -84,8 +118,7 @@ def _sync_stream_gen(response_stream: Iterator, handler: StreamingResponseHandle
     finally:
         final_content = handler.flush()
         if final_content:
-            if final_chunk := _create_flush_chunk(final_content):
-                yield final_chunk
+            yield _create_flush_chunk(final_content)
 
 
 async def _async_stream_gen(response_stream: AsyncIterator, handler: StreamingResponseHandler):
@@ -98,8 +131,7 @@ async def _async_stream_gen(response_stream: AsyncIterator, handler: StreamingRe
     finally:
         final_content = handler.flush()
         if final_content:
-            if final_chunk := _create_flush_chunk(final_content):
-                yield final_chunk
+            yield _create_flush_chunk(final_content)
 
 
 def _handle_streaming_response(
@@ -133,7 +165,7 @@ def _apply_response_patterns(response: Any, patterns: list) -> Any:
         return response
 
     handler = StreamingResponseHandler(patterns)
-    response.choices[0].message.content = handler.transform_chunk(content) + handler.flush()
+    response.choices[0].message.content = handler.transform_text(content)
     return response
 
 
@@ -192,6 +224,23 @@ def _apply_transformers(
     return context, state
 
 
+async def _aapply_transformers(
+    context: ContextWindow,
+    state: TurnState,
+    transformers: list,
+) -> tuple[ContextWindow, TurnState]:
+    """Apply transformers without running transform work on the event loop."""
+    for transformer in transformers:
+        if hasattr(transformer, "should_apply"):
+            if not transformer.should_apply(context, state):
+                continue
+        if isinstance(transformer, ContextTransformer):
+            context, state = await transformer.atransform(context, state)
+        else:
+            context, state = await asyncio.to_thread(transformer.transform, context, state)
+    return context, state
+
+
 def _collect_response_patterns(transformers: list, state: TurnState) -> list:
     """Collect response patterns from transformers."""
     patterns = []
@@ -202,6 +251,59 @@ def _collect_response_patterns(transformers: list, state: TurnState) -> list:
     return patterns
 
 
+def _get_semantic_cache(config: Any, litellm_kwargs: dict) -> SemanticCache | None:
+    """Return the configured semantic cache if it applies to this call."""
+    semantic_cache = getattr(config, "semantic_cache", None)
+    if isinstance(semantic_cache, SemanticCache) and not litellm_kwargs.get("stream", False):
+        return semantic_cache
+    return None
+
+
+def _cached_completion(
+    semantic_cache: SemanticCache,
+    model: str,
+    messages: list[dict],
+    tools: list | None,
+    tool_choice: str | dict | None,
+    litellm_kwargs: dict,
+) -> Any:
+    """Call litellm.completion through the semantic cache."""
+    key = semantic_cache.key(model, messages, tools, tool_choice=tool_choice, **litellm_kwargs)
+    if key is not None and (cached := semantic_cache.get(key)) is not None:
+        return cached
+
+    response = litellm.completion(
+        model=model, messages=messages, tools=tools, tool_choice=tool_choice, **litellm_kwargs
+    )
+    if key is not None:
+        semantic_cache.put(key, response)
+    return response
+
+
+async def _cached_acompletion(
+    semantic_cache: SemanticCache,
+    model: str,
+    messages: list[dict],
+    tools: list | None,
+    tool_choice: str | dict | None,
+    litellm_kwargs: dict,
+) -> Any:
+    """Call litellm.acompletion through the semantic cache."""
+    # Embedding models are synchronous; keep the encode off the event loop
+    key = await asyncio.to_thread(
+        semantic_cache.key, model, messages, tools, tool_choice=tool_choice, **litellm_kwargs
+    )
+    if key is not None and (cached := semantic_cache.get(key)) is not None:
+        return cached
+
+    response = await litellm.acompletion(
+        model=model, messages=messages, tools=tools, tool_choice=tool_choice, **litellm_kwargs
+    )
+    if key is not None:
+        semantic_cache.put(key, response)
+    return response
+
+
 def completion(
     model: str,
     messages: list[dict],
@@ -226,8 +328,13 @@ def completion(
         LiteLLM response or stream
     """
     config = get_config()
+    semantic_cache = _get_semantic_cache(config, litellm_kwargs)
 
     if not transformers and not config.transformers:
+        if semantic_cache is not None:
+            return _cached_completion(
+                semantic_cache, model, messages, tools, tool_choice, litellm_kwargs
+            )
         return litellm.completion(
             model=model, messages=messages, tools=tools, tool_choice=tool_choice, **litellm_kwargs
         )
@@ -238,13 +345,18 @@ def completion(
     context, state = _apply_transformers(context, state, transformer_list)
     patterns = _collect_response_patterns(transformer_list, state)
 
-    response = litellm.completion(
-        model=model,
-        messages=context.render(),
-        tools=state.tools,
-        tool_choice=tool_choice,
-        **litellm_kwargs,
-    )
+    if semantic_cache is not None:
+        response = _cached_completion(
+            semantic_cache, model, context.render(), state.tools, tool_choice, litellm_kwargs
+        )
+    else:
+        response = litellm.completion(
+            model=model,
+            messages=context.render(),
+            tools=state.tools,
+            tool_choice=tool_choice,
+            **litellm_kwargs,
+        )
 
     is_streaming = litellm_kwargs.get("stream", False)
     if patterns and is_streaming:
@@ -253,7 +365,7 @@ def completion(
         response = _apply_response_patterns(response, patterns)
 
     if debug and not is_streaming:
-        response._textile_trace = _build_trace(context, state, transformer_list)
+        response._textile_trace = _build_trace(context, state, transformer_list, response)
 
     return response
 
@@ -282,8 +394,13 @@ async def acompletion(
         LiteLLM response or stream
     """
     config = get_config()
+    semantic_cache = _get_semantic_cache(config, litellm_kwargs)
 
     if not transformers and not config.transformers:
+        if semantic_cache is not None:
+            return await _cached_acompletion(
+                semantic_cache, model, messages, tools, tool_choice, litellm_kwargs
+            )
         return await litellm.acompletion(
             model=model, messages=messages, tools=tools, tool_choice=tool_choice, **litellm_kwargs
         )
@@ -291,16 +408,21 @@ async def acompletion(
     context, state = _prepare_context(model, messages, litellm_kwargs, tools)
 
     transformer_list = transformers or config.transformers
-    context, state = _apply_transformers(context, state, transformer_list)
+    context, state = await _aapply_transformers(context, state, transformer_list)
     patterns = _collect_response_patterns(transformer_list, state)
 
-    response = await litellm.acompletion(
-        model=model,
-        messages=context.render(),
-        tools=state.tools,
-        tool_choice=tool_choice,
-        **litellm_kwargs,
-    )
+    if semantic_cache is not None:
+        response = await _cached_acompletion(
+            semantic_cache, model, context.render(), state.tools, tool_choice, litellm_kwargs
+        )
+    else:
+        response = await litellm.acompletion(
+            model=model,
+            messages=context.render(),
+            tools=state.tools,
+            tool_choice=tool_choice,
+            **litellm_kwargs,
+        )
 
     is_streaming = litellm_kwargs.get("stream", False)
     if patterns and is_streaming:
@@ -309,6 +431,6 @@ async def acompletion(
         response = _apply_response_patterns(response, patterns)
 
     if debug and not is_streaming:
-        response._textile_trace = _build_trace(context, state, transformer_list)
+        response._textile_trace = _build_trace(context, state, transformer_list, response)
 
     return response
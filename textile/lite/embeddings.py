@@ -1,5 +1,8 @@
 """Transparent wrapper around LiteLLM embedding with modern Python 3.11+ patterns."""
 
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import litellm
@@ -7,6 +10,72 @@ import litellm
 from textile.config import get_config
 from textile.utils.async_helpers import run_sync
 
+logger = logging.getLogger(__name__)
+
+# Upper bound on sub-batch requests in flight when batch_size splits the input
+MAX_CONCURRENT_BATCHES = 8
+
+# Storage is non-critical, so writes happen off the caller's path. A single
+# worker keeps events in submission order; pending writes finish at exit.
+_STORE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="textile-store")
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _split_batches(input: str | list[str], batch_size: int | None) -> list[list[str]] | None:
+    """Split list input into sub-batches, or None if one request suffices."""
+    if batch_size is not None and batch_size <= 0:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    if batch_size is None or isinstance(input, str) or len(input) <= batch_size:
+        return None
+    return [input[i : i + batch_size] for i in range(0, len(input), batch_size)]
+
+
+def _merge_embedding_responses(responses: list[Any]) -> Any:
+    """Merge sub-batch responses into the first, in order, re-indexing items."""
+    merged = responses[0]
+    data = [item for response in responses for item in response.data]
+    for index, item in enumerate(data):
+        if isinstance(item, dict):
+            item["index"] = index
+        else:
+            item.index = index
+    merged.data = data
+
+    if usage := getattr(merged, "usage", None):
+        for field in ("prompt_tokens", "total_tokens"):
+            if hasattr(usage, field):
+                total = sum(getattr(getattr(r, "usage", None), field, 0) or 0 for r in responses)
+                setattr(usage, field, total)
+
+    return merged
+
+
+def _embed(model: str, input: str | list[str], batch_size: int | None, **kwargs: Any) -> Any:
+    """Call litellm.embedding, fanning sub-batches out over a thread pool."""
+    if (batches := _split_batches(input, batch_size)) is None:
+        return litellm.embedding(model=model, input=input, **kwargs)
+
+    with ThreadPoolExecutor(max_workers=min(len(batches), MAX_CONCURRENT_BATCHES)) as pool:
+        responses = list(
+            pool.map(lambda batch: litellm.embedding(model=model, input=batch, **kwargs), batches)
+        )
+    return _merge_embedding_responses(responses)
+
+
+async def _aembed(model: str, input: str | list[str], batch_size: int | None, **kwargs: Any) -> Any:
+    """Call litellm.aembedding, gathering sub-batches concurrently."""
+    if (batches := _split_batches(input, batch_size)) is None:
+        return await litellm.aembedding(model=model, input=input, **kwargs)
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCHES)
+
+    async def _embed_batch(batch: list[str]) -> Any:
+        async with semaphore:
+            return await litellm.aembedding(model=model, input=batch, **kwargs)
+
+    responses = await asyncio.gather(*(_embed_batch(batch) for batch in batches))
+    return _merge_embedding_responses(list(responses))
+
 
 def _extract_embedding_data(
     response: Any,
@@ -59,12 +128,20 @@ def _store_embedding_event_sync(
         pass
 
 
+def _on_store_task_done(task: asyncio.Task) -> None:
+    """Release a finished background storage task, logging any failure."""
+    _background_tasks.discard(task)
+    if not task.cancelled() and (error := task.exception()) is not None:
+        logger.debug(f"Embedding storage failed: {error}")
+
+
 def _execute_embedding(
     model: str,
     input: str | list[str],
     store_in_conversation: str | None,
     *,
     is_async: bool = False,
+    batch_size: int | None = None,
     **litellm_kwargs: Any,
 ) -> Any:
     """Execute embedding call with optional storage.
@@ -74,6 +151,7 @@ def _execute_embedding(
         input: Text to embed
         store_in_conversation: Conversation ID for tracking
         is_async: Use async variant
+        batch_size: Split list input into concurrent requests of this size
         **litellm_kwargs: Passed to litellm
 
     Returns:
@@ -81,13 +159,14 @@ def _execute_embedding(
 
     Raises:
         RuntimeError: If storage requested but not configured
+        ValueError: If batch_size is not positive
     """
     config = get_config()
 
     if is_async:
-        response_coro = litellm.aembedding(model=model, input=input, **litellm_kwargs)
+        response_coro = _aembed(model, input, batch_size, **litellm_kwargs)
     else:
-        response = litellm.embedding(model=model, input=input, **litellm_kwargs)
+        response = _embed(model, input, batch_size, **litellm_kwargs)
 
     if store_in_conversation is None:
         return response_coro if is_async else response
@@ -114,25 +193,32 @@ def _execute_embedding(
             input_texts, embeddings = _extract_embedding_data(resp, input)
             metadata = _build_metadata(resp, len(embeddings[0]) if embeddings else 0)
 
-            # Storage is non-critical - embedding succeeds even if storage fails.
-            try:
-                await store.store_embedding_event(
+            # Storage is non-critical - return without waiting for the write
+            task = asyncio.create_task(
+                store.store_embedding_event(
                     conversation_id=store_in_conversation,
                     model=model,
                     input_texts=input_texts,
                     embeddings=embeddings,
                     metadata=metadata,
                 )
-            except Exception:
-                pass
+            )
+            _background_tasks.add(task)
+            task.add_done_callback(_on_store_task_done)
 
             return resp
 
         return _async_embed_and_store()
     input_texts, embeddings = _extract_embedding_data(response, input)
     metadata = _build_metadata(response, len(embeddings[0]) if embeddings else 0)
-    _store_embedding_event_sync(
-        store, store_in_conversation, model, input_texts, embeddings, metadata
+    _STORE_POOL.submit(
+        _store_embedding_event_sync,
+        store,
+        store_in_conversation,
+        model,
+        input_texts,
+        embeddings,
+        metadata,
     )
     return response
 
@@ -141,6 +227,7 @@ def embedding(
     model: str,
     input: str | list[str],
     store_in_conversation: str | None = None,
+    batch_size: int | None = None,
     **litellm_kwargs: Any,
 ) -> Any:
     """Generate embeddings with optional conversation storage.
@@ -149,6 +236,8 @@ def embedding(
         model: Model name
         input: Text to embed
         store_in_conversation: Conversation ID for tracking
+        batch_size: Split list input into concurrent requests of this size;
+            results are merged back in input order
         **litellm_kwargs: Passed to litellm
 
     Returns:
@@ -165,13 +254,21 @@ def embedding(
         ...     store_in_conversation="conv_123"
         ... )
     """
-    return _execute_embedding(model, input, store_in_conversation, is_async=False, **litellm_kwargs)
+    return _execute_embedding(
+        model,
+        input,
+        store_in_conversation,
+        is_async=False,
+        batch_size=batch_size,
+        **litellm_kwargs,
+    )
 
 
 async def aembedding(
     model: str,
     input: str | list[str],
     store_in_conversation: str | None = None,
+    batch_size: int | None = None,
     **litellm_kwargs: Any,
 ) -> Any:
     """Generate embeddings asynchronously with optional storage.
@@ -180,6 +277,8 @@ async def aembedding(
         model: Model name
         input: Text to embed
         store_in_conversation: Conversation ID for tracking
+        batch_size: Split list input into concurrent requests of this size;
+            results are merged back in input order
         **litellm_kwargs: Passed to litellm
 
     Returns:
@@ -193,5 +292,10 @@ async def aembedding(
         ...     )
     """
     return await _execute_embedding(
-        model, input, store_in_conversation, is_async=True, **litellm_kwargs
+        model,
+        input,
+        store_in_conversation,
+        is_async=True,
+        batch_size=batch_size,
+        **litellm_kwargs,
     )
@@ -0,0 +1,151 @@
+"""Semantic response cache for completion() and acompletion()."""
+
+import copy
+import hashlib
+import json
+import threading
+from typing import Any, NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+from textile.embeddings.base import EmbeddingModel
+from textile.utils.similarity import normalize
+
+
+class SemanticCacheKey(NamedTuple):
+    """Lookup key: exact digest of the request prefix plus the query embedding."""
+
+    digest: int
+    vector: npt.NDArray[np.float32]
+
+
+class SemanticCache:
+    """Reuse responses for near-identical final user messages.
+
+    Entries match only when model, tools, every message before the last and
+    the last message's role and other non-content fields (e.g. tool_call_id)
+    are identical; the last message's content is compared by cosine
+    similarity. Unit
+    vectors are kept in one contiguous float32 matrix, so a lookup is a single
+    matrix-vector product. The least recently used entry is replaced when full.
+
+    Example:
+        >>> cache = SemanticCache(Embedding("text-embedding-3-small"), threshold=0.95)
+        >>> textile.configure(semantic_cache=cache)
+    """
+
+    def __init__(
+        self,
+        embedding_model: EmbeddingModel,
+        threshold: float = 0.95,
+        max_entries: int = 1024,
+    ) -> None:
+        """Initialize semantic cache.
+
+        Args:
+            embedding_model: Model used to embed the final message
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Maximum cached responses
+
+        Raises:
+            ValueError: If parameters invalid
+        """
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+
+        self.embedding_model = embedding_model
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._vectors: npt.NDArray[np.float32] | None = None
+            self._digests = np.zeros(self.max_entries, dtype=np.int64)
+            self._last_used = np.zeros(self.max_entries, dtype=np.int64)
+            self._responses: list[Any] = []
+            self._clock = 0
+
+    def __len__(self) -> int:
+        """Number of cached responses."""
+        return len(self._responses)
+
+    def key(
+        self,
+        model: str,
+        messages: list[dict],
+        tools: list | None = None,
+        **params: Any,
+    ) -> SemanticCacheKey | None:
+        """Build the lookup key for a request.
+
+        Args:
+            model: Model name
+            messages: Messages as sent to the provider
+            tools: Tool definitions
+            **params: Other request parameters that must match exactly
+
+        Returns:
+            Key, or None if the last message has no text content
+        """
+        if not messages or not isinstance(content := messages[-1].get("content"), str):
+            return None
+
+        # Only the content is matched by similarity; the role, tool_call_id and
+        # any other fields of the last message must match exactly, so a tool
+        # result never hits a cached user turn with similar text
+        last_fields = {name: value for name, value in messages[-1].items() if name != "content"}
+        prefix = json.dumps(
+            [model, messages[:-1], last_fields, tools, params], sort_keys=True, default=str
+        )
+        digest = hashlib.blake2b(prefix.encode(), digest_size=8).digest()
+
+        vector = normalize(np.ravel(self.embedding_model.encode(content)))
+        return SemanticCacheKey(int.from_bytes(digest, "little", signed=True), vector)
+
+    def get(self, key: SemanticCacheKey) -> Any | None:
+        """Return a copy of the best cached response above threshold, if any."""
+        with self._lock:
+            if not self._responses or self._vectors is None:
+                return None
+            if key.vector.size != self._vectors.shape[1]:
+                return None
+
+            count = len(self._responses)
+            scores = self._vectors[:count] @ key.vector
+            scores[self._digests[:count] != key.digest] = -1.0
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+
+            self._clock += 1
+            self._last_used[best] = self._clock
+            response = self._responses[best]
+
+        return copy.deepcopy(response)
+
+    def put(self, key: SemanticCacheKey, response: Any) -> None:
+        """Store a copy of response under key."""
+        stored = copy.deepcopy(response)
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.zeros((self.max_entries, key.vector.size), dtype=np.float32)
+            elif key.vector.size != self._vectors.shape[1]:
+                return
+
+            if len(self._responses) < self.max_entries:
+                slot = len(self._responses)
+                self._responses.append(stored)
+            else:
+                slot = int(np.argmin(self._last_used))
+                self._responses[slot] = stored
+
+            self._clock += 1
+            self._vectors[slot] = key.vector
+            self._digests[slot] = key.digest
+            self._last_used[slot] = self._clock
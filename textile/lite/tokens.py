@@ -3,6 +3,7 @@
 import logging
 from typing import Any
 
+import numpy as np
 from litellm import (
     create_pretrained_tokenizer,
     create_tokenizer,
@@ -76,12 +77,13 @@ def _fallback_token_count(
         return max(1, len(text) // CHARS_PER_TOKEN_HEURISTIC)
 
     if messages:
-        total = 0
-        for msg in messages:
-            if "content" in msg and isinstance(msg["content"], str):
-                total += max(1, len(msg["content"]) // CHARS_PER_TOKEN_HEURISTIC)
-            total += MESSAGE_OVERHEAD_TOKENS
-        return total
+        # One vectorized reduction over content lengths; overhead applies to every message
+        lengths = np.fromiter(
+            (len(c) for msg in messages if isinstance(c := msg.get("content"), str)),
+            dtype=np.int64,
+        )
+        content_tokens = int(np.maximum(1, lengths // CHARS_PER_TOKEN_HEURISTIC).sum())
+        return content_tokens + MESSAGE_OVERHEAD_TOKENS * len(messages)
 
     return 0
 
@@ -1,5 +1,6 @@
 """Abstract base class for context transformers."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
@@ -16,6 +17,7 @@ class ContextTransformer(ABC):
     Lifecycle:
     1. should_apply() - Gate transformer execution (optional)
     2. transform() - Modify context and/or create new state
+       (atransform() under acompletion, off the event loop by default)
     3. on_response() - Register response patterns (optional)
 
     State: Context modified in-place, state immutable (use dataclasses.replace())
@@ -31,6 +33,18 @@ class ContextTransformer(ABC):
         """Apply transformation to context and/or state."""
         pass
 
+    async def atransform(
+        self,
+        context: ContextWindow,
+        state: TurnState,
+    ) -> tuple[ContextWindow, TurnState]:
+        """Async transform, used by acompletion().
+
+        Runs transform() in a worker thread so the event loop stays free;
+        override with a native async implementation where one exists.
+        """
+        return await asyncio.to_thread(self.transform, context, state)
+
     def should_apply(self, context: ContextWindow, state: TurnState) -> bool:
         """Determine if transformer should run."""
         return True
@@ -12,6 +12,8 @@ class TransformationPipeline:
     Debug mode captures trace snapshots.
     """
 
+    __slots__ = ("transformers", "debug", "trace")
+
     def __init__(self, transformers: list[ContextTransformer], debug: bool = False) -> None:
         """Initialize pipeline."""
         self.transformers = transformers
@@ -38,23 +40,25 @@ class TransformationPipeline:
             )
 
         for i, transformer in enumerate(self.transformers):
-            if transformer.should_apply(context, current_state):
-                messages_before = len(context.messages)
+            if not transformer.should_apply(context, current_state):
+                continue
+
+            if not self.debug:
                 context, current_state = transformer.transform(context, current_state)
+                continue
 
-                if self.debug:
-                    self.trace.append(
-                        {
-                            "step": i + 1,
-                            "transformer": transformer.__class__.__name__,
-                            "messages_before": messages_before,
-                            "messages_after": len(context.messages),
-                            "messages_removed": messages_before - len(context.messages),
-                            "messages": [
-                                {"role": m.role, "content": m.content} for m in context.messages
-                            ],
-                        }
-                    )
+            messages_before = len(context.messages)
+            context, current_state = transformer.transform(context, current_state)
+            self.trace.append(
+                {
+                    "step": i + 1,
+                    "transformer": transformer.__class__.__name__,
+                    "messages_before": messages_before,
+                    "messages_after": len(context.messages),
+                    "messages_removed": messages_before - len(context.messages),
+                    "messages": [{"role": m.role, "content": m.content} for m in context.messages],
+                }
+            )
 
         return context, current_state
 
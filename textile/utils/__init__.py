@@ -5,9 +5,17 @@
 """
 
 from textile.utils.async_helpers import run_sync
-from textile.utils.similarity import cosine_similarity
+from textile.utils.similarity import (
+    cosine_similarity,
+    cosine_similarity_matrix,
+    cosine_similarity_normalized,
+    normalize,
+)
 
 __all__ = [
     "cosine_similarity",
+    "cosine_similarity_matrix",
+    "cosine_similarity_normalized",
+    "normalize",
     "run_sync",
 ]
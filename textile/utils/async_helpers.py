@@ -15,15 +15,14 @@ def run_sync(coro: Coroutine[None, None, T]) -> T:
     """
     try:
         asyncio.get_running_loop()
-        raise RuntimeError(
-            "Cannot call sync API from async context. "
-            "Use the async variant instead:\n"
-            "  - Use acompletion() instead of completion()\n"
-            "  - Use aembedding() instead of embedding()\n"
-            "  - Or use 'await' if in async context"
-        )
-    except RuntimeError as e:
-        # Distinguish between our error and "no running loop" from get_running_loop.
-        if "no running event loop" in str(e).lower():
-            return asyncio.run(coro)
-        raise
+    except RuntimeError:
+        # No running loop: the normal sync case
+        return asyncio.run(coro)
+
+    raise RuntimeError(
+        "Cannot call sync API from async context. "
+        "Use the async variant instead:\n"
+        "  - Use acompletion() instead of completion()\n"
+        "  - Use aembedding() instead of embedding()\n"
+        "  - Or use 'await' if in async context"
+    )
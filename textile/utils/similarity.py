@@ -1,5 +1,7 @@
 """Cosine similarity utility for semantic comparisons."""
 
+import math
+
 import numpy as np
 import numpy.typing as npt
 
@@ -40,19 +42,133 @@ def cosine_similarity(
     a_arr = np.asarray(a, dtype=np.float32)
     b_arr = np.asarray(b, dtype=np.float32)
 
-    if a_arr.shape != b_arr.shape:
-        raise ValueError(f"Vectors must have same shape, got {a_arr.shape} and {b_arr.shape}")
-
-    if a_arr.ndim != 1:
+    if a_arr.shape != b_arr.shape or a_arr.ndim != 1:
+        if a_arr.shape != b_arr.shape:
+            raise ValueError(f"Vectors must have same shape, got {a_arr.shape} and {b_arr.shape}")
         raise ValueError(f"Vectors must be 1D, got shape {a_arr.shape}")
 
-    dot_product = np.dot(a_arr, b_arr)
+    return _cosine_unchecked(a_arr, b_arr)
+
+
+def _cosine_unchecked(a: npt.NDArray[np.float32], b: npt.NDArray[np.float32]) -> float:
+    """Cosine similarity without conversion or validation.
 
-    if (norm_a := np.linalg.norm(a_arr)) == 0 or (norm_b := np.linalg.norm(b_arr)) == 0:
+    Callers must pass 1D float32 arrays of equal shape.
+    """
+    # Squared norms come from the same dot kernel as a · b, and a single sqrt
+    # of their product replaces two norm calls. Python floats (float64) keep
+    # the product from overflowing float32.
+    dot_product = float(np.dot(a, b))
+    norm_sq_a = float(np.dot(a, a))
+    norm_sq_b = float(np.dot(b, b))
+
+    if norm_sq_a == 0 or norm_sq_b == 0:
         return 0.0
 
-    similarity = dot_product / (norm_a * norm_b)
+    similarity = dot_product / math.sqrt(norm_sq_a * norm_sq_b)
 
     # Clamp to [0, 1] for embedding vectors (handles floating-point precision)
     # Theoretical range is [-1, 1], but embeddings typically yield [0, 1]
-    return float(np.clip(similarity, 0.0, 1.0))
+    # similarity is a Python float, so clamp without a numpy ufunc call
+    return min(max(similarity, 0.0), 1.0)
+
+
+def cosine_similarity_matrix(
+    a: npt.NDArray[np.float32] | list[list[float]],
+    b: npt.NDArray[np.float32] | list[list[float]],
+) -> npt.NDArray[np.float32]:
+    """Compute cosine similarity between every row of a and every row of b.
+
+    One matrix product replaces N × M cosine_similarity() calls, and each
+    row norm is computed once rather than once per pair.
+
+    Args:
+        a: Matrix of shape (N, D)
+        b: Matrix of shape (M, D)
+
+    Returns:
+        Float32 matrix of shape (N, M), clamped to [0, 1] like
+        cosine_similarity(); pairs involving a zero row score 0.0
+
+    Raises:
+        ValueError: If inputs are not 2D or dimensions differ
+
+    Example:
+        >>> import numpy as np
+        >>> a = np.array([[1.0, 0.0], [0.0, 1.0]], dtype=np.float32)
+        >>> cosine_similarity_matrix(a, a)
+        array([[1., 0.],
+               [0., 1.]], dtype=float32)
+    """
+    a_arr = np.asarray(a, dtype=np.float32)
+    b_arr = np.asarray(b, dtype=np.float32)
+
+    if a_arr.ndim != 2 or b_arr.ndim != 2:
+        raise ValueError(f"Inputs must be 2D, got shapes {a_arr.shape} and {b_arr.shape}")
+    if a_arr.shape[1] != b_arr.shape[1]:
+        raise ValueError(f"Dimensions must match, got {a_arr.shape[1]} and {b_arr.shape[1]}")
+
+    # Row-wise sums of squares via einsum stay float32 and skip the a * a
+    # temporary np.linalg.norm materializes before reducing
+    norms_a = np.sqrt(np.einsum("ij,ij->i", a_arr, a_arr))[:, np.newaxis]
+    norms_b = np.sqrt(np.einsum("ij,ij->i", b_arr, b_arr))[:, np.newaxis]
+    # Zero rows have a zero dot product too, so flooring the denominator at a
+    # tiny epsilon gives 0.0 for them without a masked assignment
+    denom = np.maximum(norms_a * norms_b.T, np.float32(1e-12))
+
+    similarities: npt.NDArray[np.float32] = (a_arr @ b_arr.T) / denom
+    np.clip(similarities, 0.0, 1.0, out=similarities)
+    return similarities
+
+
+def normalize(vector: npt.NDArray[np.floating] | list[float]) -> npt.NDArray[np.float32]:
+    """Return an L2-normalized float32 copy of vector.
+
+    Normalize once when a vector is stored, then compare with
+    cosine_similarity_normalized() or a plain dot product.
+
+    Args:
+        vector: Vector to normalize (numpy array or list)
+
+    Returns:
+        New float32 unit vector; a zero vector is returned unchanged
+
+    Example:
+        >>> normalize([3.0, 4.0])
+        array([0.6, 0.8], dtype=float32)
+    """
+    unit = np.array(vector, dtype=np.float32)
+    # math.sqrt of a BLAS dot skips np.linalg.norm's Python-level dispatch
+    if (norm := math.sqrt(float(np.dot(unit, unit)))) > 0.0:
+        unit /= norm
+    return unit
+
+
+def cosine_similarity_normalized(
+    a: npt.NDArray[np.float32] | list[float],
+    b: npt.NDArray[np.float32] | list[float],
+) -> float:
+    """Compute cosine similarity between already L2-normalized vectors.
+
+    For unit vectors cos(θ) = a · b, so this is a single dot product with no
+    norm computation. Use with vectors normalized once at storage time, such
+    as MessageMetadata.unit_embedding.
+
+    Args:
+        a: First unit vector (numpy array or list)
+        b: Second unit vector (numpy array or list)
+
+    Returns:
+        Similarity score clamped to [0, 1], matching cosine_similarity()
+
+    Raises:
+        ValueError: If shapes are not aligned
+
+    Example:
+        >>> import numpy as np
+        >>> a = np.array([0.6, 0.8], dtype=np.float32)
+        >>> cosine_similarity_normalized(a, a)
+        1.0
+    """
+    similarity = float(np.dot(a, b))
+    return min(max(similarity, 0.0), 1.0)
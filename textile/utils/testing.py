@@ -13,6 +13,12 @@ from textile.core.message import Message
 from textile.core.turn_state import TurnState
 from textile.transformers.base import ContextTransformer
 
+# Distinguishes an absent turn_index key from an explicit value
+_MISSING: Any = object()
+
+# Token budget for test contexts built without an explicit max_tokens
+DEFAULT_MAX_TOKENS = 16384
+
 
 def create_message(
     role: str,
@@ -54,7 +60,7 @@ def create_context(
 
     Args:
         messages: List of message dicts or Message instances
-        max_tokens: Optional max token limit
+        max_tokens: Optional max token limit (defaults to DEFAULT_MAX_TOKENS)
 
     Returns:
         ContextWindow instance
@@ -72,21 +78,21 @@ def create_context(
             msg_list.append(item)
         else:
             msg = Message.from_dict(item)
-            if "turn_index" in item:
-                msg.turn_index = item["turn_index"]
+            if (turn_index := item.get("turn_index", _MISSING)) is not _MISSING:
+                msg.turn_index = turn_index
             msg_list.append(msg)
 
-    kwargs = {"messages": msg_list}
-    if max_tokens is not None:
-        kwargs["max_tokens"] = max_tokens
-
-    return ContextWindow(**kwargs)
+    return ContextWindow(
+        messages=msg_list,
+        max_tokens=DEFAULT_MAX_TOKENS if max_tokens is None else max_tokens,
+    )
 
 
 def create_turn_state(
     turn_index: int = 0,
     metadata: dict[str, Any] | None = None,
     tools: list[dict[str, Any]] | None = None,
+    user_message: str = "",
 ) -> TurnState:
     """Create a test turn state.
 
@@ -94,6 +100,7 @@ def create_turn_state(
         turn_index: Current turn index
         metadata: Optional metadata dict
         tools: Optional tools list
+        user_message: Current user message
 
     Returns:
         TurnState instance
@@ -104,6 +111,7 @@ def create_turn_state(
         >>> assert state.metadata["test"] is True
     """
     return TurnState(
+        user_message=user_message,
         turn_index=turn_index,
         metadata=metadata or {},
         tools=tools or [],
@@ -168,16 +176,16 @@ def assert_message_preserved(
         assert msg is not None, f"Message {message_id} not found"
         return
 
-    for msg in context.messages:
-        if role is not None and msg.role != role:
-            continue
-        if content is not None and content not in msg.content:
-            continue
-        return  # Found matching message
-
-    raise AssertionError(
-        f"No message found with role={role}, content={content}"
+    found = next(
+        (
+            msg
+            for msg in context.messages
+            if (role is None or msg.role == role) and (content is None or content in msg.content)
+        ),
+        None,
     )
+    if found is None:
+        raise AssertionError(f"No message found with role={role}, content={content}")
 
 
 def assert_system_messages_preserved(context: ContextWindow) -> None:
@@ -201,8 +209,9 @@ def assert_system_messages_preserved(context: ContextWindow) -> None:
     """
     # This is a convention check - system messages should always remain
     # Can't verify without original context, but can check they exist
-    system_messages = [m for m in context.messages if m.role == "system"]
-    assert len(system_messages) > 0, "No system messages found - may have been removed"
+    assert any(m.role == "system" for m in context.messages), (
+        "No system messages found - may have been removed"
+    )
 
 
 class TransformerTestCase:
@@ -270,6 +279,45 @@ class TransformerTestCase:
             Tuple of (transformed_context, transformed_state)
         """
         context, state = self.create_test_context(messages, current_turn)
+        return self._transform_and_check(transformer, context, state, expected_removed)
+
+    def assert_applied_and_apply(
+        self,
+        transformer: ContextTransformer,
+        messages: list[dict[str, Any]],
+        current_turn: int = 0,
+        expected_removed: int | None = None,
+    ) -> tuple[ContextWindow, TurnState]:
+        """Assert a transformer applies, then apply it to the same context.
+
+        Combines assert_transformer_applied() and apply_transformer() so the
+        test context is built once instead of once per call.
+
+        Args:
+            transformer: Transformer to test
+            messages: Test messages
+            current_turn: Current turn index
+            expected_removed: Optional check for removed count
+
+        Returns:
+            Tuple of (transformed_context, transformed_state)
+
+        Raises:
+            AssertionError: If should_apply returns False or the removed
+                count does not match
+        """
+        context, state = self.create_test_context(messages, current_turn)
+        self.assert_transformer_applied(transformer, context, state)
+        return self._transform_and_check(transformer, context, state, expected_removed)
+
+    def _transform_and_check(
+        self,
+        transformer: ContextTransformer,
+        context: ContextWindow,
+        state: TurnState,
+        expected_removed: int | None,
+    ) -> tuple[ContextWindow, TurnState]:
+        """Run transform() and optionally check the removed message count."""
         original_count = len(context.messages)
 
         new_context, new_state = transformer.transform(context, state)
@@ -277,8 +325,7 @@ class TransformerTestCase:
         if expected_removed is not None:
             removed = original_count - len(new_context.messages)
             assert removed == expected_removed, (
-                f"Expected {expected_removed} messages removed, "
-                f"got {removed}"
+                f"Expected {expected_removed} messages removed, got {removed}"
             )
 
         return new_context, new_state
@@ -326,27 +373,32 @@ class TransformerTestCase:
 
 # Pytest fixtures for common test scenarios
 
+
 @pytest.fixture
 def simple_context():
     """Fixture providing a simple 3-message context."""
-    return create_context([
-        {"role": "system", "content": "You are helpful."},
-        {"role": "user", "content": "Hello"},
-        {"role": "assistant", "content": "Hi there!"},
-    ])
+    return create_context(
+        [
+            {"role": "system", "content": "You are helpful."},
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": "Hi there!"},
+        ]
+    )
 
 
 @pytest.fixture
 def multi_turn_context():
     """Fixture providing a multi-turn conversation."""
-    return create_context([
-        {"role": "system", "content": "You are helpful.", "turn_index": 0},
-        {"role": "user", "content": "Message 1", "turn_index": 1},
-        {"role": "assistant", "content": "Response 1", "turn_index": 2},
-        {"role": "user", "content": "Message 2", "turn_index": 3},
-        {"role": "assistant", "content": "Response 2", "turn_index": 4},
-        {"role": "user", "content": "Message 3", "turn_index": 5},
-    ])
+    return create_context(
+        [
+            {"role": "system", "content": "You are helpful.", "turn_index": 0},
+            {"role": "user", "content": "Message 1", "turn_index": 1},
+            {"role": "assistant", "content": "Response 1", "turn_index": 2},
+            {"role": "user", "content": "Message 2", "turn_index": 3},
+            {"role": "assistant", "content": "Response 2", "turn_index": 4},
+            {"role": "user", "content": "Message 3", "turn_index": 5},
+        ]
+    )
 
 
 @pytest.fixture